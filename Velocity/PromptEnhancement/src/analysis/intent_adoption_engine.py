@@ -12,20 +12,108 @@ This builds on the existing intent analysis system to focus on adoption and util
 """
 
 import asyncio
+import heapq
 import json
+import re
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, TYPE_CHECKING
 from dataclasses import dataclass, asdict
-from enum import Enum
-from collections import defaultdict, deque
+from enum import Enum, IntEnum
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from operator import itemgetter
 import logging
 
-# Import existing intent analysis components
-from src.analysis.intent_analyzer import IntentAnalyzer, IntentAnalysis
-from src.analysis.intent_classifier import IntentClassifier, IntentResult
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Existing intent analysis components are imported lazily in
+# IntentAdoptionEngine.__init__ to keep module import cheap
+if TYPE_CHECKING:
+    from src.analysis.intent_analyzer import IntentAnalysis
+    from src.analysis.intent_classifier import IntentResult
 
 logger = logging.getLogger(__name__)
 
+# Intent category strings are used as dict keys on every request, so intern
+# them once to make key comparisons identity checks
+_CATEGORIES = tuple(sys.intern(s) for s in [
+    "code_assistance", "data_analysis", "content_creation", "question",
+    "research", "problem_solving", "educational_content", "unclear"
+])
+(_CODE_ASSISTANCE, _DATA_ANALYSIS, _CONTENT_CREATION, _QUESTION,
+ _RESEARCH, _PROBLEM_SOLVING, _EDUCATIONAL_CONTENT, _UNCLEAR) = _CATEGORIES
+
+# Keywords for quick text-part classification, in priority order: the first
+# category with any keyword present in the text wins
+_TEXT_PART_INTENT_KEYWORDS = (
+    (_CODE_ASSISTANCE, ("code", "function", "script", "programming", "debug", "syntax")),
+    (_DATA_ANALYSIS, ("analyze", "analysis", "data", "statistics", "trends", "insights")),
+    (_CONTENT_CREATION, ("write", "create", "generate", "content", "article", "blog")),
+    (_QUESTION, ("what", "how", "why", "when", "where", "explain")),
+    (_RESEARCH, ("research", "find", "search", "information", "study")),
+    (_PROBLEM_SOLVING, ("solve", "fix", "problem", "issue", "troubleshoot")),
+    (_EDUCATIONAL_CONTENT, ("learn", "teach", "tutorial", "guide", "understand")),
+)
+_TEXT_PART_INTENT_PRIORITY = {
+    category: priority for priority, (category, _) in enumerate(_TEXT_PART_INTENT_KEYWORDS)
+}
+# One alternation with a named group per category. It is wrapped in a
+# lookahead so matches may overlap and every keyword occurrence is seen.
+_TEXT_PART_INTENT_RE = re.compile("(?=" + "|".join(
+    f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+    for category, keywords in _TEXT_PART_INTENT_KEYWORDS
+) + ")")
+
+# Intents that users often combine with a given intent
+_INTENT_RELATIONSHIPS: Dict[str, Tuple[str, ...]] = {
+    "code_assistance": ("data_analysis", "problem_solving", "debugging"),
+    "data_analysis": ("data_visualization", "code_assistance", "research"),
+    "content_creation": ("creative_generation", "educational_content", "action_request"),
+    "problem_solving": ("code_assistance", "analysis", "research"),
+    "research": ("data_analysis", "summarization", "factual_verification")
+}
+
+# Example prompts per intent category
+_EXAMPLE_PROMPTS = {
+    "code_assistance": "Help me write a Python function to calculate fibonacci numbers with error handling",
+    "data_analysis": "Analyze this sales dataset to identify seasonal trends and top-performing products",
+    "content_creation": "Write a technical blog post about API design best practices for developer audience",
+    "research": "Research the latest trends in machine learning for natural language processing"
+}
+
+# Prompt enhancement templates per intent, formatted with the user's prompt
+_ENHANCEMENT_TEMPLATES = {
+    "code_assistance": "Enhanced: {prompt} - Please include error handling, comments, and example usage",
+    "data_analysis": "Enhanced: {prompt} - Include data format, analysis goals, and visualization preferences",
+    "content_creation": "Enhanced: {prompt} - Specify target audience, tone, length, and format requirements"
+}
+_DEFAULT_ENHANCEMENT_TEMPLATE = "Enhanced: {prompt} - Add more specific context and requirements"
+
+# Single-intent simplification templates, formatted with the intent's text
+_SIMPLIFIED_TEMPLATES = {
+    "code_assistance": "Focus on coding: Help me write clean, efficient code for {text}...",
+    "data_analysis": "Focus on analysis: Analyze this data to find {text}...",
+    "content_creation": "Focus on writing: Create engaging content about {text}...",
+    "research": "Focus on research: Find comprehensive information about {text}..."
+}
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Truncate text to `limit` characters, appending an ellipsis when cut."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+def _json_default(obj: Any) -> Any:
+    """Serialize enums that the JSON encoder can't handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class AdoptionStage(Enum):
     """User adoption stages for intent-driven features."""
     DISCOVERY = "discovery"          # User discovers intent features
@@ -34,6 +122,25 @@ class AdoptionStage(Enum):
     MASTERY = "mastery"            # User uses advanced intent patterns
     ADVOCACY = "advocacy"          # User shares/teaches intent features
 
+# Priority used to pick a user's overall stage, biased toward higher stages
+_STAGE_PRIORITY = {
+    AdoptionStage.MASTERY: 5,
+    AdoptionStage.ADOPTION: 4,
+    AdoptionStage.EXPLORATION: 3,
+    AdoptionStage.DISCOVERY: 2
+}
+
+# Usage and success thresholds for promoting an intent's adoption stage
+_MASTERY_MIN_USAGE, _MASTERY_MIN_SUCCESS = 20, 0.8
+_ADOPTION_MIN_USAGE, _ADOPTION_MIN_SUCCESS = 10, 0.7
+_EXPLORATION_MIN_USAGE = 5
+
+# Stage for the number of thresholds met; below exploration the stage is kept
+_STAGE_BY_LEVEL = (None, AdoptionStage.EXPLORATION, AdoptionStage.ADOPTION, AdoptionStage.MASTERY)
+
+# Stages that count a user as having adopted an intent
+_ADOPTED_STAGES = (AdoptionStage.ADOPTION, AdoptionStage.MASTERY)
+
 class UsagePattern(Enum):
     """Common usage patterns for intent analysis."""
     SINGLE_SHOT = "single_shot"               # One-off queries
@@ -42,7 +149,21 @@ class UsagePattern(Enum):
     CONTEXTUAL = "contextual"                 # Building on previous context
     EXPLORATORY = "exploratory"               # Trying different approaches
 
-@dataclass
+class DifficultyLevel(IntEnum):
+    """Difficulty of applying a usage recommendation."""
+    EASY = 1
+    MEDIUM = 2
+    ADVANCED = 3
+
+class RecommendationType(IntEnum):
+    """Kinds of usage recommendations offered to users."""
+    COORDINATION = 1
+    SIMPLIFICATION = 2
+    RELATED_INTENT = 3
+    ENHANCEMENT = 4
+    IMPROVEMENT = 5
+
+@dataclass(slots=True)
 class IntentAdoptionMetrics:
     """Metrics for tracking intent adoption success."""
     user_id: str
@@ -73,20 +194,24 @@ class IntentAdoptionMetrics:
         data['stage'] = self.stage.value
         return data
 
-@dataclass
+@dataclass(slots=True)
 class IntentRecommendation:
     """Recommendation for improving intent usage."""
     intent_category: str
-    recommendation_type: str
+    recommendation_type: RecommendationType
     title: str
     description: str
     example_prompt: str
-    difficulty_level: str
+    difficulty_level: DifficultyLevel
     estimated_benefit: float
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        data = asdict(self)
+        # Convert enums to their lowercase string names
+        data['recommendation_type'] = self.recommendation_type.name.lower()
+        data['difficulty_level'] = self.difficulty_level.name.lower()
+        return data
     
 class IntentAdoptionEngine:
     """
@@ -101,16 +226,37 @@ class IntentAdoptionEngine:
         self.config = config or {}
         
         # Initialize existing components
+        from src.analysis.intent_analyzer import IntentAnalyzer
+        from src.analysis.intent_classifier import IntentClassifier
         self.intent_analyzer = IntentAnalyzer(config)
         self.intent_classifier = IntentClassifier()
         
         # User adoption tracking
         self.user_metrics: Dict[str, Dict[str, IntentAdoptionMetrics]] = defaultdict(dict)
-        self.platform_patterns = defaultdict(list)
+        # Overall stage per user and platform-wide aggregates, all refreshed
+        # whenever a user's metrics change. Per-intent aggregates are
+        # [count, usage_sum, success_sum, adopted_count].
+        self._user_overall_stage: Dict[str, AdoptionStage] = {}
+        self._intent_agg: Dict[str, List] = defaultdict(lambda: [0, 0, 0.0, 0])
+        self._stage_counts: Counter = Counter()
+        
+        # Pattern histories are append-only, so cap them to keep memory bounded
+        # on long-running servers
+        history_maxlen = self.config.get("pattern_history_maxlen", 1024)
+        self.platform_patterns: Dict[str, deque] = defaultdict(lambda: deque(maxlen=history_maxlen))
         
         # Adoption insights and recommendations
-        self.adoption_insights = defaultdict(list)
-        self.success_patterns = defaultdict(list)
+        self.adoption_insights: Dict[str, deque] = defaultdict(lambda: deque(maxlen=history_maxlen))
+        self.success_patterns: Dict[str, deque] = defaultdict(lambda: deque(maxlen=history_maxlen))
+        
+        # Multi-intent detection: conjunctions and separators that indicate
+        # multiple requests, padded with spaces for whole-word matching
+        self._multi_intent_separators = tuple(
+            f" {sep} " for sep in [
+                "and", "also", "then", "after that", "plus", "furthermore", "additionally",
+                "next", "followed by", "as well as", "besides", "moreover"
+            ]
+        )
         
         # Initialize adoption strategies
         self._init_adoption_strategies()
@@ -189,6 +335,37 @@ class IntentAdoptionEngine:
                 }
             ]
         }
+        self.success_patterns_db = {
+            sys.intern(category): patterns for category, patterns in self.success_patterns_db.items()
+        }
+        
+        # Per-category indexes over the patterns, so request handling never
+        # has to scan them
+        self._best_pattern_by_category: Dict[str, Dict[str, Any]] = {}
+        self._best_example_by_intent: Dict[str, str] = {}
+        self._pattern_token_sets: Dict[str, List[frozenset]] = {}
+        for category in self.success_patterns_db:
+            self._refresh_pattern_index(category)
+    
+    def _refresh_pattern_index(self, category: str):
+        """
+        Rebuild the pattern indexes for a category.
+        
+        Must be called after any change to success_patterns_db[category].
+        """
+        patterns = self.success_patterns_db.get(category)
+        if not patterns:
+            self._best_pattern_by_category.pop(category, None)
+            self._best_example_by_intent.pop(category, None)
+            self._pattern_token_sets.pop(category, None)
+            return
+        
+        best_pattern = max(patterns, key=lambda x: x["success_rate"])
+        self._best_pattern_by_category[category] = best_pattern
+        self._best_example_by_intent[category] = best_pattern["example"]
+        self._pattern_token_sets[category] = [
+            frozenset(pattern["template"].lower().split()) for pattern in patterns
+        ]
     
     async def analyze_intent_for_adoption(self, 
                                         prompt: str, 
@@ -205,6 +382,87 @@ class IntentAdoptionEngine:
         Returns:
             Dict containing intent analysis plus adoption insights
         """
+        adoption_analysis, factors = await self._build_adoption_analysis(prompt, user_id)
+        adoption_analysis["success_probability"] = min(1.0, sum(factors))
+        return adoption_analysis
+    
+    async def analyze_intent_for_adoption_bytes(self,
+                                              prompt: str,
+                                              user_id: Optional[str] = None,
+                                              session_context: Optional[Dict] = None) -> bytes:
+        """
+        Analyze intent for adoption and return the result as JSON bytes.
+        
+        Equivalent to analyze_intent_for_adoption followed by JSON encoding;
+        the saving is only in the encoding, which orjson does straight to
+        bytes rather than building a str with json.dumps and encoding it.
+        
+        Args:
+            prompt: User's prompt
+            user_id: Optional user ID for personalization
+            session_context: Optional session context
+            
+        Returns:
+            UTF-8 encoded JSON of the adoption analysis
+        """
+        adoption_analysis, factors = await self._build_adoption_analysis(prompt, user_id)
+        adoption_analysis["success_probability"] = min(1.0, sum(factors))
+        
+        if orjson is not None:
+            return orjson.dumps(adoption_analysis, default=_json_default)
+        return json.dumps(adoption_analysis, default=_json_default).encode("utf-8")
+    
+    async def analyze_batch(self,
+                            prompts: List[str],
+                            user_ids: Optional[List[Optional[str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze a batch of prompts for adoption, e.g. for analytics replay or bulk onboarding.
+        
+        Prompts are analyzed in order, so usage tracking matches sequential
+        calls to analyze_intent_for_adoption; the success probabilities are
+        then combined for the whole batch in one vectorized step.
+        
+        Args:
+            prompts: User prompts to analyze
+            user_ids: Optional user IDs aligned with prompts
+            
+        Returns:
+            List of adoption analyses, one per prompt
+        """
+        if user_ids is None:
+            user_ids = [None] * len(prompts)
+        if len(user_ids) != len(prompts):
+            raise ValueError("prompts and user_ids must have the same length")
+        
+        analyses = []
+        factor_rows = []
+        for prompt, user_id in zip(prompts, user_ids):
+            adoption_analysis, factors = await self._build_adoption_analysis(prompt, user_id)
+            analyses.append(adoption_analysis)
+            factor_rows.append(factors)
+        
+        if not analyses:
+            return analyses
+        
+        # Columns: base, pattern bonus, user, multi-intent, quality
+        factors = np.asarray(factor_rows, dtype=np.float64)
+        probabilities = np.minimum(
+            1.0, factors[:, 0] + factors[:, 1] + factors[:, 2] + factors[:, 3] + factors[:, 4]
+        )
+        for adoption_analysis, probability in zip(analyses, probabilities.tolist()):
+            adoption_analysis["success_probability"] = probability
+        
+        return analyses
+    
+    async def _build_adoption_analysis(self,
+                                       prompt: str,
+                                       user_id: Optional[str]) -> Tuple[Dict[str, Any], Tuple[float, ...]]:
+        """
+        Build the adoption analysis for a prompt and track its usage.
+        
+        The success probability is left to the caller; its additive factors
+        are returned alongside the analysis, computed before usage tracking.
+        """
         # Get standard intent analysis
         intent_analysis = self.intent_analyzer.analyze_intent(prompt)
         intent_result = self.intent_classifier.classify_intent(prompt)
@@ -232,11 +490,11 @@ class IntentAdoptionEngine:
             ],
             "pattern_suggestions": self._suggest_better_patterns(
                 intent_result.main_intent, prompt, multi_intent_analysis
-            ),
-            "success_probability": self._calculate_success_probability(
-                prompt, intent_analysis, user_id, multi_intent_analysis
             )
         }
+        factors = self._success_probability_factors(
+            prompt, intent_analysis, user_id, multi_intent_analysis
+        )
         
         # Track usage for all detected intents if user_id provided
         if user_id:
@@ -248,7 +506,7 @@ class IntentAdoptionEngine:
                 if intent_info["intent"] != intent_result.main_intent:
                     await self._track_intent_usage(user_id, intent_info["intent"], prompt)
         
-        return adoption_analysis
+        return adoption_analysis, factors
     
     async def _analyze_multiple_intents(self, prompt: str, intent_result) -> Dict[str, Any]:
         """
@@ -269,19 +527,22 @@ class IntentAdoptionEngine:
             "coordination_strategy": "sequential"
         }
         
+        # Most prompts are short single-intent requests; skip the pipeline when
+        # there is no separator or sentence break to split on
+        prompt_lower = prompt.lower()
+        if ('.' not in prompt and '?' not in prompt
+                and not any(sep in prompt_lower for sep in self._multi_intent_separators)):
+            return multi_intent_info
+        
         try:
             # Quick pattern-based detection for common multi-intent scenarios
             potential_intents = []
             
-            # Look for conjunctions and separators that indicate multiple requests
-            separators = ["and", "also", "then", "after that", "plus", "furthermore", "additionally", 
-                         "next", "followed by", "as well as", "besides", "moreover"]
-            
             # Split by common separators and analyze each part
             parts = []
-            for sep in separators:
-                if f" {sep} " in prompt.lower():
-                    parts = [part.strip() for part in prompt.lower().split(f" {sep} ")]
+            for sep in self._multi_intent_separators:
+                if sep in prompt_lower:
+                    parts = [part.strip() for part in prompt_lower.split(sep)]
                     break
             
             # Also check for sentence-based splits
@@ -300,7 +561,7 @@ class IntentAdoptionEngine:
                     
                     # Quick intent classification for each part
                     part_intent = self._classify_text_part_intent(part)
-                    if part_intent != "unclear":
+                    if part_intent is not _UNCLEAR:
                         potential_intents.append({
                             "intent": part_intent,
                             "text": part,
@@ -312,7 +573,7 @@ class IntentAdoptionEngine:
             if intent_result.main_intent not in [pi["intent"] for pi in potential_intents]:
                 potential_intents.insert(0, {
                     "intent": intent_result.main_intent,
-                    "text": prompt[:100] + "..." if len(prompt) > 100 else prompt,
+                    "text": _truncate(prompt),
                     "confidence": intent_result.confidence,
                     "sequence": 0
                 })
@@ -337,37 +598,17 @@ class IntentAdoptionEngine:
     
     def _classify_text_part_intent(self, text: str) -> str:
         """Quick intent classification for text parts."""
-        text_lower = text.lower()
-        
-        # Code-related
-        if any(word in text_lower for word in ["code", "function", "script", "programming", "debug", "syntax"]):
-            return "code_assistance"
-        
-        # Analysis-related
-        if any(word in text_lower for word in ["analyze", "analysis", "data", "statistics", "trends", "insights"]):
-            return "data_analysis"
-        
-        # Content creation
-        if any(word in text_lower for word in ["write", "create", "generate", "content", "article", "blog"]):
-            return "content_creation"
-        
-        # Questions
-        if any(word in text_lower for word in ["what", "how", "why", "when", "where", "explain"]):
-            return "question"
-        
-        # Research
-        if any(word in text_lower for word in ["research", "find", "search", "information", "study"]):
-            return "research"
-        
-        # Problem solving
-        if any(word in text_lower for word in ["solve", "fix", "problem", "issue", "troubleshoot"]):
-            return "problem_solving"
-        
-        # Learning
-        if any(word in text_lower for word in ["learn", "teach", "tutorial", "guide", "understand"]):
-            return "educational_content"
+        best_priority = None
+        for match in _TEXT_PART_INTENT_RE.finditer(text.lower()):
+            priority = _TEXT_PART_INTENT_PRIORITY[match.lastgroup]
+            if best_priority is None or priority < best_priority:
+                best_priority = priority
+                if priority == 0:
+                    break
         
-        return "unclear"
+        if best_priority is None:
+            return _UNCLEAR
+        return _TEXT_PART_INTENT_KEYWORDS[best_priority][0]
     
     def _suggest_intent_breakdown(self, intents: List[Dict]) -> List[str]:
         """Suggest how to break down the multi-intent prompt."""
@@ -404,8 +645,8 @@ class IntentAdoptionEngine:
     
     async def _generate_adoption_insights(self, 
                                         prompt: str, 
-                                        intent_analysis: IntentAnalysis,
-                                        intent_result: IntentResult,
+                                        intent_analysis: 'IntentAnalysis',
+                                        intent_result: 'IntentResult',
                                         user_id: Optional[str],
                                         multi_intent_analysis: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Generate insights for improving intent adoption."""
@@ -434,11 +675,8 @@ class IntentAdoptionEngine:
             })
         
         # Pattern recognition insight
-        if intent_result.main_intent in self.success_patterns_db:
-            best_pattern = max(
-                self.success_patterns_db[intent_result.main_intent],
-                key=lambda x: x["success_rate"]
-            )
+        best_pattern = self._best_pattern_by_category.get(intent_result.main_intent)
+        if best_pattern is not None:
             insights.append({
                 "type": "pattern",
                 "title": "Use High-Success Pattern",
@@ -477,7 +715,7 @@ class IntentAdoptionEngine:
     
     async def _generate_usage_recommendations(self,
                                             prompt: str,
-                                            intent_analysis: IntentAnalysis,
+                                            intent_analysis: 'IntentAnalysis',
                                             user_id: Optional[str],
                                             multi_intent_analysis: Dict[str, Any] = None) -> List[IntentRecommendation]:
         """Generate recommendations for better intent usage."""
@@ -491,11 +729,11 @@ class IntentAdoptionEngine:
             # Recommend intent coordination
             recommendations.append(IntentRecommendation(
                 intent_category="multi_intent",
-                recommendation_type="coordination",
+                recommendation_type=RecommendationType.COORDINATION,
                 title=f"Coordinate {len(detected_intents)} Intents Effectively",
                 description=f"Your prompt has multiple intents that can be handled {multi_intent_analysis.get('coordination_strategy', 'sequentially')}",
                 example_prompt=self._create_multi_intent_example(detected_intents, multi_intent_analysis.get('coordination_strategy')),
-                difficulty_level="advanced",
+                difficulty_level=DifficultyLevel.ADVANCED,
                 estimated_benefit=0.85
             ))
             
@@ -503,11 +741,11 @@ class IntentAdoptionEngine:
             if multi_intent_analysis.get("intent_complexity") == "complex":
                 recommendations.append(IntentRecommendation(
                     intent_category="prompt_optimization",
-                    recommendation_type="simplification",
+                    recommendation_type=RecommendationType.SIMPLIFICATION,
                     title="Break Down Complex Request",
                     description="Consider splitting your complex request into separate, focused prompts",
                     example_prompt=self._create_simplified_prompt_example(detected_intents[0]),
-                    difficulty_level="easy",
+                    difficulty_level=DifficultyLevel.EASY,
                     estimated_benefit=0.9
                 ))
         
@@ -516,11 +754,11 @@ class IntentAdoptionEngine:
         for related_intent in related_intents[:2]:
             recommendations.append(IntentRecommendation(
                 intent_category=related_intent,
-                recommendation_type="related_intent",
+                recommendation_type=RecommendationType.RELATED_INTENT,
                 title=f"Try {related_intent.replace('_', ' ').title()}",
                 description=f"Users often combine {primary_intent} with {related_intent} for better results",
                 example_prompt=self._generate_example_prompt(related_intent),
-                difficulty_level="medium",
+                difficulty_level=DifficultyLevel.MEDIUM,
                 estimated_benefit=0.7
             ))
         
@@ -528,11 +766,11 @@ class IntentAdoptionEngine:
         if intent_analysis.confidence_score < 0.8:
             recommendations.append(IntentRecommendation(
                 intent_category=primary_intent,
-                recommendation_type="enhancement",
+                recommendation_type=RecommendationType.ENHANCEMENT,
                 title="Enhance Your Prompt",
                 description="Add specific context and requirements for better results",
                 example_prompt=self._enhance_prompt_example(prompt, primary_intent),
-                difficulty_level="easy",
+                difficulty_level=DifficultyLevel.EASY,
                 estimated_benefit=0.8
             ))
         
@@ -560,32 +798,46 @@ class IntentAdoptionEngine:
         
         if intent_category in self.success_patterns_db:
             patterns = self.success_patterns_db[intent_category]
-            for pattern in patterns:
+            similarities = self._pattern_similarity_batch(
+                prompt, self._pattern_token_sets[intent_category]
+            )
+            for pattern, similarity in zip(patterns, similarities):
                 suggestions.append({
                     "pattern_name": pattern["pattern"],
                     "template": pattern["template"],
                     "success_rate": pattern["success_rate"],
                     "example": pattern["example"],
-                    "improvement_potential": self._calculate_improvement_potential(
-                        prompt, pattern["template"]
-                    )
+                    "improvement_potential": max(0.0, 1.0 - similarity)
                 })
         
         return suggestions
     
     def _calculate_success_probability(self,
                                      prompt: str,
-                                     intent_analysis: IntentAnalysis,
+                                     intent_analysis: 'IntentAnalysis',
                                      user_id: Optional[str],
                                      multi_intent_analysis: Dict[str, Any] = None) -> float:
         """Calculate probability of successful intent fulfillment."""
+        return min(1.0, sum(self._success_probability_factors(
+            prompt, intent_analysis, user_id, multi_intent_analysis
+        )))
+    
+    def _success_probability_factors(self,
+                                     prompt: str,
+                                     intent_analysis: 'IntentAnalysis',
+                                     user_id: Optional[str],
+                                     multi_intent_analysis: Dict[str, Any] = None) -> Tuple[float, ...]:
+        """Compute the additive factors of the success probability."""
         base_probability = intent_analysis.confidence_score
         
         # Pattern matching bonus
         pattern_bonus = 0.0
         if intent_analysis.primary_intent in self.success_patterns_db:
             patterns = self.success_patterns_db[intent_analysis.primary_intent]
-            best_match = max(patterns, key=lambda x: self._pattern_similarity(prompt, x["template"]))
+            similarities = self._pattern_similarity_batch(
+                prompt, self._pattern_token_sets[intent_analysis.primary_intent]
+            )
+            best_match = patterns[max(range(len(patterns)), key=similarities.__getitem__)]
             pattern_bonus = best_match["success_rate"] * 0.2
         
         # User history factor
@@ -619,16 +871,18 @@ class IntentAdoptionEngine:
         # Prompt quality factor
         quality_factor = min(len(prompt.split()) / 20, 0.1)  # Longer prompts tend to be more successful
         
-        success_probability = min(1.0, base_probability + pattern_bonus + user_factor + multi_intent_factor + quality_factor)
-        return success_probability
+        return (base_probability, pattern_bonus, user_factor, multi_intent_factor, quality_factor)
     
     async def _track_intent_usage(self, user_id: str, intent_category: str, prompt: str):
         """Track user's intent usage for adoption analytics."""
         current_time = time.time()
+        user_data = self.user_metrics[user_id]
+        metrics = user_data.get(intent_category)
+        previous = None if metrics is None else self._metrics_contribution(metrics)
         
-        if intent_category not in self.user_metrics[user_id]:
+        if metrics is None:
             # First time using this intent
-            self.user_metrics[user_id][intent_category] = IntentAdoptionMetrics(
+            metrics = user_data[intent_category] = IntentAdoptionMetrics(
                 user_id=user_id,
                 intent_category=intent_category,
                 usage_count=1,
@@ -642,17 +896,59 @@ class IntentAdoptionEngine:
             )
         else:
             # Update existing metrics
-            metrics = self.user_metrics[user_id][intent_category]
             metrics.usage_count += 1
             metrics.last_usage = current_time
             
-            # Update adoption stage based on usage
-            if metrics.usage_count >= 20 and metrics.success_rate >= 0.8:
-                metrics.stage = AdoptionStage.MASTERY
-            elif metrics.usage_count >= 10 and metrics.success_rate >= 0.7:
-                metrics.stage = AdoptionStage.ADOPTION
-            elif metrics.usage_count >= 5:
-                metrics.stage = AdoptionStage.EXPLORATION
+            # Update adoption stage based on usage. The thresholds are nested,
+            # so the number of thresholds met indexes the new stage.
+            usage_count, success_rate = metrics.usage_count, metrics.success_rate
+            level = (
+                (usage_count >= _EXPLORATION_MIN_USAGE)
+                + ((usage_count >= _ADOPTION_MIN_USAGE) & (success_rate >= _ADOPTION_MIN_SUCCESS))
+                + ((usage_count >= _MASTERY_MIN_USAGE) & (success_rate >= _MASTERY_MIN_SUCCESS))
+            )
+            if level:
+                metrics.stage = _STAGE_BY_LEVEL[level]
+        
+        self._update_adoption_caches(user_id, metrics, previous)
+    
+    @staticmethod
+    def _metrics_contribution(metrics: IntentAdoptionMetrics) -> Tuple[int, float, int]:
+        """Contribution of one metrics entry to the platform aggregates."""
+        return metrics.usage_count, metrics.success_rate, int(metrics.stage in _ADOPTED_STAGES)
+    
+    def _update_adoption_caches(self,
+                                user_id: str,
+                                metrics: IntentAdoptionMetrics,
+                                previous: Optional[Tuple[int, float, int]]):
+        """
+        Apply a metrics change to the cached platform aggregates and user stage.
+        
+        Args:
+            user_id: User whose metrics changed
+            metrics: The updated metrics entry
+            previous: The entry's contribution before the change, or None if new
+        """
+        usage_count, success_rate, adopted = self._metrics_contribution(metrics)
+        agg = self._intent_agg[metrics.intent_category]
+        if previous is None:
+            agg[0] += 1
+            agg[1] += usage_count
+            agg[2] += success_rate
+            agg[3] += adopted
+        else:
+            agg[1] += usage_count - previous[0]
+            if success_rate != previous[1]:
+                agg[2] += success_rate - previous[1]
+            agg[3] += adopted - previous[2]
+        
+        previous_stage = self._user_overall_stage.get(user_id)
+        stage = self._determine_overall_stage(self.user_metrics[user_id])
+        if stage is not previous_stage:
+            if previous_stage is not None:
+                self._stage_counts[previous_stage] -= 1
+            self._stage_counts[stage] += 1
+            self._user_overall_stage[user_id] = stage
     
     def get_user_adoption_profile(self, user_id: str) -> Dict[str, Any]:
         """Get user's intent adoption profile."""
@@ -669,25 +965,26 @@ class IntentAdoptionEngine:
             }
         
         user_data = self.user_metrics[user_id]
-        total_interactions = sum(metrics.usage_count for metrics in user_data.values())
-        avg_success_rate = sum(metrics.success_rate for metrics in user_data.values()) / len(user_data)
+        
+        # Aggregate totals and engagement scores in a single pass
+        total_interactions = 0
+        success_sum = 0.0
+        scored = []
+        improvement_areas = []
+        for intent, metrics in user_data.items():
+            total_interactions += metrics.usage_count
+            success_sum += metrics.success_rate
+            scored.append((metrics.calculate_engagement_score(), intent, metrics))
+            if metrics.success_rate < 0.6:
+                improvement_areas.append(intent)
+        avg_success_rate = success_sum / len(user_data)
         
         # Get strongest intents
-        strongest_intents = sorted(
-            user_data.items(),
-            key=lambda x: x[1].calculate_engagement_score(),
-            reverse=True
-        )[:3]
-        
-        # Get improvement areas
-        improvement_areas = [
-            intent for intent, metrics in user_data.items()
-            if metrics.success_rate < 0.6
-        ]
+        strongest_intents = heapq.nlargest(3, scored, key=itemgetter(0))
         
         return {
             "user_id": user_id,
-            "stage": self._determine_overall_stage(user_data).value,
+            "stage": self._get_overall_stage(user_id).value,
             "intents_used": len(user_data),
             "total_interactions": total_interactions,
             "avg_success_rate": avg_success_rate,
@@ -696,98 +993,69 @@ class IntentAdoptionEngine:
                     "intent": intent,
                     "usage_count": metrics.usage_count,
                     "success_rate": metrics.success_rate,
-                    "engagement_score": metrics.calculate_engagement_score()
+                    "engagement_score": engagement_score
                 }
-                for intent, metrics in strongest_intents
+                for engagement_score, intent, metrics in strongest_intents
             ],
             "improvement_areas": improvement_areas,
-            "recommendations": self._get_user_recommendations(user_id)
+            "recommendations": self._get_user_recommendations(user_id, low_perf=improvement_areas)
         }
     
     def get_platform_adoption_analytics(self) -> Dict[str, Any]:
         """Get platform-wide intent adoption analytics."""
-        all_intents = defaultdict(list)
-        user_stages = defaultdict(int)
-        
-        # Aggregate data
-        for user_id, user_data in self.user_metrics.items():
-            stage = self._determine_overall_stage(user_data)
-            user_stages[stage.value] += 1
-            
-            for intent, metrics in user_data.items():
-                all_intents[intent].append(metrics)
-        
-        # Calculate intent adoption rates
-        intent_adoption = {}
-        for intent, metrics_list in all_intents.items():
-            intent_adoption[intent] = {
-                "total_users": len(metrics_list),
-                "avg_usage_count": sum(m.usage_count for m in metrics_list) / len(metrics_list),
-                "avg_success_rate": sum(m.success_rate for m in metrics_list) / len(metrics_list),
-                "adoption_rate": len([m for m in metrics_list if m.stage.value in ["adoption", "mastery"]]) / len(metrics_list)
+        # Aggregates are maintained incrementally by _track_intent_usage; intents
+        # are reported by name so the output doesn't depend on tracking order
+        intent_adoption = {
+            intent: {
+                "total_users": count,
+                "avg_usage_count": usage_sum / count,
+                "avg_success_rate": success_sum / count,
+                "adoption_rate": adopted_count / count
             }
+            for intent, (count, usage_sum, success_sum, adopted_count) in sorted(self._intent_agg.items())
+        }
         
         return {
             "total_users": len(self.user_metrics),
-            "user_stage_distribution": dict(user_stages),
+            "user_stage_distribution": {
+                stage.value: count for stage, count in self._stage_counts.items() if count
+            },
             "intent_adoption_rates": intent_adoption,
-            "top_adopted_intents": sorted(
+            # Highest adoption first, ties broken by intent name
+            "top_adopted_intents": heapq.nsmallest(
+                5,
                 intent_adoption.items(),
-                key=lambda x: x[1]["adoption_rate"],
-                reverse=True
-            )[:5],
+                key=lambda x: (-x[1]["adoption_rate"], x[0])
+            ),
             "improvement_opportunities": self._identify_improvement_opportunities(intent_adoption)
         }
     
+    def _get_overall_stage(self, user_id: str) -> AdoptionStage:
+        """Get user's overall adoption stage, preferring the cached value."""
+        stage = self._user_overall_stage.get(user_id)
+        if stage is None:
+            stage = self._determine_overall_stage(self.user_metrics.get(user_id, {}))
+        return stage
+    
     def _determine_overall_stage(self, user_data: Dict[str, IntentAdoptionMetrics]) -> AdoptionStage:
         """Determine user's overall adoption stage."""
         if not user_data:
             return AdoptionStage.DISCOVERY
         
-        stages = [metrics.stage for metrics in user_data.values()]
-        stage_counts = defaultdict(int)
-        for stage in stages:
-            stage_counts[stage] += 1
-        
-        # Return the most common stage, with bias toward higher stages
-        stage_priority = {
-            AdoptionStage.MASTERY: 5,
-            AdoptionStage.ADOPTION: 4,
-            AdoptionStage.EXPLORATION: 3,
-            AdoptionStage.DISCOVERY: 2
-        }
-        
-        return max(stages, key=lambda s: stage_priority[s])
+        # Return the highest stage reached across the user's intents
+        return max(user_data.values(), key=lambda m: _STAGE_PRIORITY[m.stage]).stage
     
-    def _get_related_intents(self, intent: str) -> List[str]:
+    def _get_related_intents(self, intent: str) -> Tuple[str, ...]:
         """Get related intents that work well together."""
-        intent_relationships = {
-            "code_assistance": ["data_analysis", "problem_solving", "debugging"],
-            "data_analysis": ["data_visualization", "code_assistance", "research"],
-            "content_creation": ["creative_generation", "educational_content", "action_request"],
-            "problem_solving": ["code_assistance", "analysis", "research"],
-            "research": ["data_analysis", "summarization", "factual_verification"]
-        }
-        return intent_relationships.get(intent, [])
+        return _INTENT_RELATIONSHIPS.get(intent, ())
     
     def _generate_example_prompt(self, intent_category: str) -> str:
         """Generate example prompt for an intent category."""
-        examples = {
-            "code_assistance": "Help me write a Python function to calculate fibonacci numbers with error handling",
-            "data_analysis": "Analyze this sales dataset to identify seasonal trends and top-performing products",
-            "content_creation": "Write a technical blog post about API design best practices for developer audience",
-            "research": "Research the latest trends in machine learning for natural language processing"
-        }
-        return examples.get(intent_category, "Example prompt for better results")
+        return _EXAMPLE_PROMPTS.get(intent_category, "Example prompt for better results")
     
     def _enhance_prompt_example(self, prompt: str, intent: str) -> str:
         """Show how to enhance a prompt for better results."""
-        enhancements = {
-            "code_assistance": f"Enhanced: {prompt} - Please include error handling, comments, and example usage",
-            "data_analysis": f"Enhanced: {prompt} - Include data format, analysis goals, and visualization preferences",
-            "content_creation": f"Enhanced: {prompt} - Specify target audience, tone, length, and format requirements"
-        }
-        return enhancements.get(intent, f"Enhanced: {prompt} - Add more specific context and requirements")
+        return _ENHANCEMENT_TEMPLATES.get(intent, _DEFAULT_ENHANCEMENT_TEMPLATE).format(prompt=prompt)
     
     def _create_multi_intent_example(self, detected_intents: List[Dict], coordination_strategy: str) -> str:
         """Create example prompt showing how to coordinate multiple intents."""
@@ -807,37 +1075,25 @@ class IntentAdoptionEngine:
     
     def _create_simplified_prompt_example(self, primary_intent_info: Dict) -> str:
         """Create simplified prompt example focusing on single intent."""
-        intent_name = primary_intent_info["intent"].replace("_", " ")
+        intent = primary_intent_info["intent"]
         original_text = primary_intent_info.get("text", "")
         
-        simplified_examples = {
-            "code_assistance": f"Focus on coding: Help me write clean, efficient code for {original_text[:30]}...",
-            "data_analysis": f"Focus on analysis: Analyze this data to find {original_text[:30]}...",
-            "content_creation": f"Focus on writing: Create engaging content about {original_text[:30]}...",
-            "research": f"Focus on research: Find comprehensive information about {original_text[:30]}..."
-        }
-        
-        return simplified_examples.get(
-            primary_intent_info["intent"], 
-            f"Focus on {intent_name}: {original_text[:50]}..."
-        )
-    
-    def _pattern_similarity(self, prompt: str, template: str) -> float:
-        """Calculate similarity between prompt and success pattern template."""
-        # Simple keyword-based similarity
-        prompt_words = set(prompt.lower().split())
-        template_words = set(template.lower().split())
+        template = _SIMPLIFIED_TEMPLATES.get(intent)
+        if template is not None:
+            return template.format(text=original_text[:30])
         
-        if not template_words:
-            return 0.0
-        
-        intersection = prompt_words & template_words
-        return len(intersection) / len(template_words)
+        intent_name = intent.replace("_", " ")
+        return f"Focus on {intent_name}: {original_text[:50]}..."
     
-    def _calculate_improvement_potential(self, prompt: str, template: str) -> float:
-        """Calculate potential improvement from using a pattern."""
-        current_similarity = self._pattern_similarity(prompt, template)
-        return max(0.0, 1.0 - current_similarity)
+    def _pattern_similarity_batch(self, prompt: str, template_token_sets: List[frozenset]) -> List[float]:
+        """Calculate similarity between a prompt and several pre-tokenized templates."""
+        # Prompts rarely repeat, so they are tokenized per call; template
+        # token sets are precomputed by _refresh_pattern_index
+        prompt_words = frozenset(prompt.lower().split())
+        return [
+            len(prompt_words & template_words) / len(template_words) if template_words else 0.0
+            for template_words in template_token_sets
+        ]
     
     async def _get_personalized_recommendations(self, user_id: str, intent: str) -> List[IntentRecommendation]:
         """Get personalized recommendations for a user."""
@@ -849,11 +1105,11 @@ class IntentAdoptionEngine:
             if metrics.success_rate < 0.7:
                 recommendations.append(IntentRecommendation(
                     intent_category=intent,
-                    recommendation_type="improvement",
+                    recommendation_type=RecommendationType.IMPROVEMENT,
                     title="Improve Success Rate",
                     description=f"Your {intent} success rate is {metrics.success_rate:.0%}. Try these patterns:",
                     example_prompt=self._get_best_pattern_for_intent(intent),
-                    difficulty_level="medium",
+                    difficulty_level=DifficultyLevel.MEDIUM,
                     estimated_benefit=0.9
                 ))
         
@@ -861,16 +1117,16 @@ class IntentAdoptionEngine:
     
     def _get_best_pattern_for_intent(self, intent: str) -> str:
         """Get the best success pattern for an intent."""
-        if intent in self.success_patterns_db:
-            best_pattern = max(
-                self.success_patterns_db[intent],
-                key=lambda x: x["success_rate"]
-            )
-            return best_pattern["example"]
-        return "Use specific, detailed prompts with clear context"
+        return self._best_example_by_intent.get(intent, "Use specific, detailed prompts with clear context")
     
-    def _get_user_recommendations(self, user_id: str) -> List[str]:
-        """Get general recommendations for a user."""
+    def _get_user_recommendations(self, user_id: str, low_perf: Optional[List[str]] = None) -> List[str]:
+        """
+        Get general recommendations for a user.
+        
+        Args:
+            user_id: User ID
+            low_perf: Optional precomputed list of the user's low-success intents
+        """
         if user_id not in self.user_metrics:
             return ["Start exploring intent-driven features to improve your results"]
         
@@ -878,15 +1134,18 @@ class IntentAdoptionEngine:
         recommendations = []
         
         # Stage-based recommendations
-        overall_stage = self._determine_overall_stage(user_data)
+        overall_stage = self._get_overall_stage(user_id)
         stage_recs = self.adoption_strategies[overall_stage]["tactics"]
         recommendations.extend(stage_recs[:2])
         
         # Intent-specific recommendations
-        low_performing_intents = [
-            intent for intent, metrics in user_data.items()
-            if metrics.success_rate < 0.6
-        ]
+        if low_perf is not None:
+            low_performing_intents = low_perf
+        else:
+            low_performing_intents = [
+                intent for intent, metrics in user_data.items()
+                if metrics.success_rate < 0.6
+            ]
         
         if low_performing_intents:
             recommendations.append(f"Focus on improving {low_performing_intents[0]} with more specific prompts")
@@ -897,32 +1156,38 @@ class IntentAdoptionEngine:
         """Identify platform-wide improvement opportunities."""
         opportunities = []
         
-        # Low adoption intents
-        low_adoption = [
-            intent for intent, data in intent_adoption.items()
-            if data["adoption_rate"] < 0.3
-        ]
+        # Low adoption intents (only the first three are reported)
+        low_adoption = list(islice(
+            (intent for intent, data in intent_adoption.items() if data["adoption_rate"] < 0.3),
+            3
+        ))
         
         if low_adoption:
-            opportunities.append(f"Improve adoption for: {', '.join(low_adoption[:3])}")
+            opportunities.append(f"Improve adoption for: {', '.join(low_adoption)}")
         
         # Low success rate intents
-        low_success = [
-            intent for intent, data in intent_adoption.items()
-            if data["avg_success_rate"] < 0.6
-        ]
+        low_success = list(islice(
+            (intent for intent, data in intent_adoption.items() if data["avg_success_rate"] < 0.6),
+            3
+        ))
         
         if low_success:
-            opportunities.append(f"Improve success patterns for: {', '.join(low_success[:3])}")
+            opportunities.append(f"Improve success patterns for: {', '.join(low_success)}")
         
         return opportunities
 
 # Singleton instance for easy access
 _intent_adoption_engine = None
+_intent_adoption_engine_lock = threading.Lock()
 
 def get_intent_adoption_engine(config: Optional[Dict[str, Any]] = None) -> IntentAdoptionEngine:
     """Get the global Intent Adoption Engine instance."""
     global _intent_adoption_engine
-    if _intent_adoption_engine is None:
-        _intent_adoption_engine = IntentAdoptionEngine(config)
-    return _intent_adoption_engine 
\ No newline at end of file
+    engine = _intent_adoption_engine
+    if engine is None:
+        # Double-checked so only first-time initialization takes the lock
+        with _intent_adoption_engine_lock:
+            if _intent_adoption_engine is None:
+                _intent_adoption_engine = IntentAdoptionEngine(config)
+            engine = _intent_adoption_engine
+    return engine 
\ No newline at end of file
@@ -7,25 +7,112 @@ of ambiguous queries and can generate clarification strategies when needed.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Any
 import re
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
+import heapq
+import json
 import logging
-from dataclasses import dataclass
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
+from operator import itemgetter
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Set up logging; handler and level configuration is left to the application
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, init=False)
 class IntentAnalysis:
-    """Result of intent analysis with probability distribution."""
-    intent_distribution: Dict[str, float]
+    """
+    Result of intent analysis with probability distribution.
+
+    The distribution is held as a probability vector over intent_labels; the
+    intent_distribution dict view is only built when first accessed. It can
+    still be passed to the constructor or assigned, which lays the vector out
+    over the distribution's own intents.
+    """
+    intent_vector: np.ndarray = field(compare=False)
+    intent_labels: Sequence[str] = field(repr=False)
+    intent_order: Sequence[int]
     confidence_regions: Dict[str, float]
     ambiguity_zones: List[str]
     primary_intent: str
     confidence_score: float
     clarification_needed: bool
+    _intent_distribution: Optional[Dict[str, float]] = field(default=None, repr=False, compare=False)
+
+    def __init__(self,
+                 intent_distribution: Dict[str, float],
+                 confidence_regions: Dict[str, float],
+                 ambiguity_zones: List[str],
+                 primary_intent: str,
+                 confidence_score: float,
+                 clarification_needed: bool):
+        self.intent_distribution = intent_distribution
+        self.confidence_regions = confidence_regions
+        self.ambiguity_zones = ambiguity_zones
+        self.primary_intent = primary_intent
+        self.confidence_score = confidence_score
+        self.clarification_needed = clarification_needed
+
+    @classmethod
+    def from_vector(cls,
+                    intent_vector: np.ndarray,
+                    intent_labels: Sequence[str],
+                    intent_order: Sequence[int],
+                    confidence_regions: Dict[str, float],
+                    ambiguity_zones: List[str],
+                    primary_intent: str,
+                    confidence_score: float,
+                    clarification_needed: bool) -> 'IntentAnalysis':
+        """
+        Create an IntentAnalysis directly from a probability vector.
+
+        Args:
+            intent_vector: Probabilities by intent_labels row
+            intent_labels: Intent labels the vector is laid out over
+            intent_order: Rows of the vector in distribution order
+
+        Returns:
+            IntentAnalysis whose distribution dict is built on first access
+        """
+        analysis = cls.__new__(cls)
+        analysis.intent_vector = intent_vector
+        analysis.intent_labels = intent_labels
+        analysis.intent_order = intent_order
+        analysis.confidence_regions = confidence_regions
+        analysis.ambiguity_zones = ambiguity_zones
+        analysis.primary_intent = primary_intent
+        analysis.confidence_score = confidence_score
+        analysis.clarification_needed = clarification_needed
+        analysis._intent_distribution = None
+        return analysis
+
+    @property
+    def intent_distribution(self) -> Dict[str, float]:
+        """Intent probabilities keyed by intent, in distribution order."""
+        if self._intent_distribution is None:
+            values = self.intent_vector.tolist()
+            self._intent_distribution = {self.intent_labels[row]: values[row] for row in self.intent_order}
+        return self._intent_distribution
+
+    @intent_distribution.setter
+    def intent_distribution(self, intent_distribution: Dict[str, float]) -> None:
+        self.intent_labels = tuple(intent_distribution)
+        self.intent_order = range(len(self.intent_labels))
+        self.intent_vector = np.fromiter(intent_distribution.values(), dtype=float, count=len(self.intent_labels))
+        self._intent_distribution = intent_distribution
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -38,6 +125,275 @@ class IntentAnalysis:
             "clarification_needed": self.clarification_needed
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], intent_labels: Sequence[str]) -> 'IntentAnalysis':
+        """
+        Create an IntentAnalysis from the output of to_dict.
+
+        Args:
+            data: Dictionary produced by to_dict
+            intent_labels: Intent labels the distribution is laid out over
+
+        Returns:
+            IntentAnalysis equal to the serialized one
+        """
+        # Rebuild the probability vector and its distribution order
+        label_rows = {label: row for row, label in enumerate(intent_labels)}
+        intent_vector = np.zeros(len(intent_labels))
+        intent_order = []
+        for intent, probability in data["intent_distribution"].items():
+            row = label_rows[intent]
+            intent_vector[row] = probability
+            intent_order.append(row)
+        intent_vector.flags.writeable = False
+
+        # Intern names so they compare by identity with freshly computed ones
+        return cls.from_vector(
+            intent_vector=intent_vector,
+            intent_labels=intent_labels,
+            intent_order=tuple(intent_order),
+            confidence_regions={
+                sys.intern(intent): float(probability) for intent, probability in data["confidence_regions"].items()
+            },
+            ambiguity_zones=[sys.intern(zone) for zone in data["ambiguity_zones"]],
+            primary_intent=sys.intern(data["primary_intent"]),
+            confidence_score=float(data["confidence_score"]),
+            clarification_needed=bool(data["clarification_needed"])
+        )
+
+
+# Sentence boundaries used to find imperative sentences
+_SENT_SPLIT_RE = re.compile(r'[.!?]')
+
+# Question words signalling an information request
+_QUESTION_WORDS = ("what", "who", "where", "when", "why", "how")
+
+# Verbs that open an imperative sentence
+_IMPERATIVE_VERBS = ("create", "generate", "write", "make", "build", "develop", "implement")
+
+# Signals checked inside imperative sentences: (intent, weight, words)
+_IMPERATIVE_RULES = (
+    # Code-related imperatives - very strong signal
+    ("code_generation", 0.9, ("code", "function", "program", "algorithm", "class", "module")),
+    # Creative imperatives - very strong signal
+    ("creative_generation", 0.9, ("story", "poem", "creative", "imagine", "fiction", "narrative")),
+    # Data visualization imperatives
+    ("data_visualization", 0.9, ("visualization", "chart", "graph", "plot", "dashboard", "diagram")),
+    # Educational content imperatives
+    ("educational_content", 0.9, ("lesson", "course", "tutorial", "educational", "teaching")),
+)
+
+# Phrase signals checked against the whole input: (intent, weight, phrases)
+_STRUCTURE_RULES = (
+    ("comparison", 0.9, ("compare", "difference between", "versus", "vs", "pros and cons", "similarities", "differences")),
+    ("problem_solving", 0.8, ("how to", "how do i", "help me", "solve", "fix", "troubleshoot", "debug")),
+    ("explanation", 0.8, ("explain", "clarify", "describe", "elaborate on", "tell me about")),
+    ("summarization", 0.9, ("summarize", "summary", "overview", "tldr", "in brief")),
+    ("analysis", 0.8, ("analyze", "analysis", "examine", "investigate", "evaluate")),
+    ("data_analysis", 0.9, ("analyze data", "data analysis", "statistics", "metrics", "trends", "patterns")),
+    ("data_visualization", 0.9, ("visualize data", "data visualization", "chart", "graph", "plot")),
+    ("research", 0.9, ("research", "literature review", "academic research", "scientific inquiry")),
+    ("recommendation", 0.9, ("recommend", "what's the best", "suggest", "advice", "should I")),
+)
+
+# Positions in the top five intents compared for secondary ambiguity zones
+_AMBIGUITY_PAIRS = ((1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (3, 4))
+
+
+# Clarification questions for known ambiguous intent pairs (interned below)
+_CLARIFICATION_QUESTIONS = {
+    frozenset(("action_request", "information_request")):
+        "Are you looking for information about this topic, or do you want me to create something specific?",
+    frozenset(("code_generation", "creative_generation")):
+        "Would you like me to write creative content, or are you looking for code implementation?",
+    frozenset(("factual_verification", "opinion")):
+        "Are you asking for my opinion on this matter, or would you like me to verify factual information?",
+    frozenset(("explanation", "problem_solving")):
+        "Would you like me to help solve this problem, or would you prefer an explanation of how it works?",
+    frozenset(("analysis", "comparison")):
+        "Would you like me to compare these items directly, or provide a deeper analysis of each one?",
+    frozenset(("explanation", "summarization")):
+        "Would you like a concise summary, or a more detailed explanation with context and reasoning?",
+    frozenset(("data_analysis", "visualization")):
+        "Would you like me to analyze the data and provide insights, or create visualizations of the data?",
+    frozenset(("comparison", "recommendation")):
+        "Would you like me to recommend the best option for you, or provide a detailed comparison of all options?",
+    frozenset(("debugging", "explanation")):
+        "Would you like me to help debug this issue and find a solution, or explain why this issue might be occurring?",
+    frozenset(("brainstorming", "planning")):
+        "Would you like me to help create a structured plan, or generate creative ideas and possibilities?",
+    frozenset(("data_analysis", "data_visualization")):
+        "Would you like me to analyze the data to find insights, or create visual representations of the data?",
+    frozenset(("educational_content", "explanation")):
+        "Would you like me to create structured educational materials, or provide an explanation of this topic?",
+    frozenset(("analysis", "research")):
+        "Would you like me to conduct research on this topic, or analyze existing information?",
+    frozenset(("action_request", "data_visualization")):
+        "Would you like me to create a visualization of data, or are you asking me to perform a different action?",
+    frozenset(("action_request", "creative_generation")):
+        "Would you like me to perform a specific action, or create something creative for you?",
+    frozenset(("information_request", "recommendation")):
+        "Are you looking for factual information, or would you like me to provide a recommendation?",
+    frozenset(("code_generation", "problem_solving")):
+        "Would you like me to write code for you, or help you solve a problem without necessarily writing code?",
+    frozenset(("educational_content", "information_request")):
+        "Would you like me to create structured educational content, or just provide specific information?",
+    frozenset(("action_request", "code_generation")):
+        "Would you like me to write code for you, or perform some other action?",
+}
+_CLARIFICATION_QUESTIONS = {pair: sys.intern(question) for pair, question in _CLARIFICATION_QUESTIONS.items()}
+
+
+def _index_keywords(intent_keywords: Dict[str, List[str]], intent_index: Dict[str, int]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Map each distinct keyword to the rows of the intents that list it.
+
+    Args:
+        intent_keywords: Intent-to-keywords table
+        intent_index: Intent-to-row mapping of the probability vector
+
+    Returns:
+        Dictionary mapping keywords to intent rows, repeated once per listing
+    """
+    index = defaultdict(list)
+    for intent, keywords in intent_keywords.items():
+        for keyword in keywords:
+            index[keyword].append(intent_index[intent])
+    return {keyword: tuple(rows) for keyword, rows in index.items()}
+
+
+def _zone_names(intents: Sequence[str]) -> Dict[Tuple[str, str], str]:
+    """
+    Precompute ambiguity zone names for every ordered pair of intents.
+
+    Args:
+        intents: Intent categories
+
+    Returns:
+        Dictionary mapping (intent_a, intent_b) to the sorted, joined zone name
+    """
+    # Zone names are interned like the intent names they join, so equal names
+    # coming from elsewhere resolve to the same objects
+    return {
+        (intent_a, intent_b): sys.intern("_".join(sorted((intent_a, intent_b))))
+        for intent_a in intents
+        for intent_b in intents
+        if intent_a != intent_b
+    }
+
+
+def _zone_clarification(zone: str) -> Optional[Tuple[frozenset, str]]:
+    """
+    Resolve the clarification question for an ambiguity zone.
+
+    Args:
+        zone: Ambiguity zone name joining two intents with "_"
+
+    Returns:
+        Tuple of (intent pair, question), or None if the zone does not name two intents
+    """
+    intents = zone.split("_")
+    if len(intents) != 2:
+        return None
+
+    intent1, intent2 = intents
+    intent_pair = frozenset(intents)
+    question = _CLARIFICATION_QUESTIONS.get(intent_pair)
+    if question is None:
+        # Generic clarification for other ambiguity pairs, interned so every
+        # strategy asking it shares one string
+        question = sys.intern(f"I'm not sure if you're looking for {intent1.replace('_', ' ')} or {intent2.replace('_', ' ')}. Could you clarify?")
+    return intent_pair, question
+
+
+def _keyword_matchers(keyword_rows: Dict[str, Tuple[int, ...]]) -> Dict[str, Tuple[Tuple[int, ...], bool, str]]:
+    """
+    Precompute how each keyword is scored once it occurs in an input.
+
+    A single-word keyword matches exactly when it is one of the input's
+    whitespace tokens; a phrase matches exactly when it appears surrounded by
+    spaces, so its space-padded form is prebuilt.
+
+    Args:
+        keyword_rows: Mapping of keywords to their intent rows
+
+    Returns:
+        Dictionary mapping keywords to (rows, is_single_word, exact_probe)
+    """
+    matchers = {}
+    for keyword, rows in keyword_rows.items():
+        is_single_word = keyword.split() == [keyword]
+        matchers[keyword] = (rows, is_single_word, keyword if is_single_word else f" {keyword} ")
+    return matchers
+
+
+def _build_keyword_automaton(keyword_payloads: Dict[str, Any]) -> Optional[Any]:
+    """
+    Compile keywords into an Aho-Corasick automaton when pyahocorasick is installed.
+
+    Args:
+        keyword_payloads: Mapping of keywords to the value reported for each match
+
+    Returns:
+        Automaton yielding the payload of each match, or None if unavailable
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, payload in keyword_payloads.items():
+        automaton.add_word(keyword, payload)
+    automaton.make_automaton()
+    return automaton
+
+
+def _phrase_rule_indexes(rules: Tuple[Tuple[str, float, Tuple[str, ...]], ...]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Map each phrase of a rule table to the indexes of the rules using it.
+
+    Args:
+        rules: Table of (intent, weight, phrases) rules
+
+    Returns:
+        Dictionary mapping phrases to rule indexes
+    """
+    indexes = defaultdict(list)
+    for index, (_, _, phrases) in enumerate(rules):
+        for phrase in phrases:
+            indexes[phrase].append(index)
+    return {phrase: tuple(rule_indexes) for phrase, rule_indexes in indexes.items()}
+
+
+# Single-pass matchers reporting which imperative and structure rules fire
+_IMPERATIVE_AUTOMATON = _build_keyword_automaton(_phrase_rule_indexes(_IMPERATIVE_RULES))
+_STRUCTURE_AUTOMATON = _build_keyword_automaton(_phrase_rule_indexes(_STRUCTURE_RULES))
+
+
+def _apply_phrase_rules(rules: Tuple[Tuple[str, float, Tuple[str, ...]], ...], automaton: Optional[Any],
+                        text: str, probabilities: Dict[str, float]) -> None:
+    """
+    Add the weight of every rule with a phrase occurring in the text.
+
+    Fired rules are applied in table order, whether found by the automaton
+    or by scanning each rule's phrases.
+
+    Args:
+        rules: Table of (intent, weight, phrases) rules
+        automaton: Automaton built from the rules' phrases, or None
+        text: Text to search
+        probabilities: Probability distribution to update
+    """
+    if automaton is not None:
+        fired_rules = set()
+        for _, rule_indexes in automaton.iter(text):
+            fired_rules.update(rule_indexes)
+        for index in sorted(fired_rules):
+            intent, weight, _ = rules[index]
+            probabilities[intent] += weight
+    else:
+        for intent, weight, phrases in rules:
+            if any(phrase in text for phrase in phrases):
+                probabilities[intent] += weight
+
 
 class ProbabilisticIntentField:
     """
@@ -212,6 +568,27 @@ class ProbabilisticIntentField:
         ]
     }
 
+    # Fixed layout of the intent probability vector
+    _INTENT_INDEX = {intent: row for row, intent in enumerate(INTENT_CATEGORIES)}
+
+    # Rows in INTENT_KEYWORDS order and the reciprocal keyword count of each row
+    _KEYWORD_ORDER = tuple(map(_INTENT_INDEX.get, INTENT_KEYWORDS))
+    _INV_KEYWORD_COUNTS = dict(zip(_KEYWORD_ORDER, (1.0 / len(keywords) for keywords in INTENT_KEYWORDS.values())))
+
+    # Ambiguity zone name for each ordered pair of categories
+    _ZONE_NAMES = _zone_names(INTENT_CATEGORIES)
+
+    # Clarification for every zone the field can produce, resolved up front
+    _ZONE_CLARIFICATIONS = {zone: _zone_clarification(zone) for zone in set(_ZONE_NAMES.values())}
+
+    # Share of the keyword score awarded for the fraction of exact matches
+    _EXACT_MATCH_BOOST = 0.5
+
+    # Keyword -> (intent rows, exact-match probe) table and the single-pass
+    # matcher built from it
+    _KEYWORD_MATCHERS = _keyword_matchers(_index_keywords(INTENT_KEYWORDS, _INTENT_INDEX))
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(_KEYWORD_MATCHERS)
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the ProbabilisticIntentField.
@@ -230,11 +607,17 @@ class ProbabilisticIntentField:
         self.domain_thresholds = self.config.get("domain_thresholds", {})
 
         # Initialize state
-        self.intent_distributions = {}
+        self.intent_vector = np.zeros(len(self.INTENT_CATEGORIES))
+        self.intent_order = ()
         self.confidence_regions = {}
         self.ambiguity_zones = []
         self.current_domain = None
 
+        # Memoize intent fields on the normalized input and effective thresholds,
+        # so threshold changes never hit stale entries
+        self.intent_field_cache_size = self.config.get("intent_field_cache_size", 1024)
+        self._cached_intent_field = lru_cache(maxsize=self.intent_field_cache_size)(self._compute_intent_field)
+
         logger.debug("Initialized ProbabilisticIntentField")
 
     def get_thresholds_for_domain(self, domain: Optional[str] = None) -> Dict[str, float]:
@@ -271,41 +654,105 @@ class ProbabilisticIntentField:
         Returns:
             IntentAnalysis object with intent distribution and related information
         """
-        logger.info(f"Generating intent field for input: {user_input[:50]}...")
+        logger.info("Generating intent field for input: %.50s...", user_input)
 
         # Store current domain
         self.current_domain = domain
 
         # Get domain-specific thresholds
         thresholds = self.get_thresholds_for_domain(domain)
-        domain_ambiguity_threshold = thresholds["ambiguity_threshold"]
-        domain_confidence_threshold = thresholds["confidence_threshold"]
-        domain_clarification_threshold = thresholds["clarification_threshold"]
 
-        # Compute intent probabilities
-        self.intent_distributions = self.compute_intent_probabilities(user_input)
+        intent_analysis = self._to_intent_analysis(self._cached_intent_field(
+            user_input.lower(),
+            thresholds["ambiguity_threshold"],
+            thresholds["confidence_threshold"],
+            thresholds["clarification_threshold"]
+        ))
 
-        # Identify high certainty areas using domain-specific threshold
-        self.confidence_regions = self.identify_high_certainty_areas(
-            self.intent_distributions,
-            confidence_threshold=domain_confidence_threshold
-        )
+        logger.info("Generated intent field with primary intent: %s, confidence: %.2f",
+                    intent_analysis.primary_intent, intent_analysis.confidence_score)
+        return intent_analysis
 
-        # Flag uncertain regions using domain-specific threshold
-        self.ambiguity_zones = self.flag_uncertain_regions(
-            self.intent_distributions,
-            ambiguity_threshold=domain_ambiguity_threshold
-        )
+    def generate_intent_field_batch(self, user_inputs: List[str], domain: Optional[str] = None) -> List[IntentAnalysis]:
+        """
+        Generate intent fields for many inputs at once.
 
-        # Get primary intent and confidence score
-        primary_intent, confidence_score = self._get_primary_intent(self.intent_distributions)
+        Inputs are scored one by one, then all score vectors are normalized
+        together as a matrix. Results match calling generate_intent_field on
+        each input; the memoization cache is neither consulted nor filled.
 
-        # Determine if clarification is needed using domain-specific threshold
-        clarification_needed = confidence_score < domain_clarification_threshold or len(self.ambiguity_zones) > 0
+        Args:
+            user_inputs: The user queries or prompts
+            domain: Optional domain for domain-specific thresholds
+
+        Returns:
+            List of IntentAnalysis objects, in input order
+        """
+        logger.info("Generating intent fields for a batch of %d inputs", len(user_inputs))
+
+        # Store current domain
+        self.current_domain = domain
+        if not user_inputs:
+            return []
+
+        # Get domain-specific thresholds
+        thresholds = self.get_thresholds_for_domain(domain)
+
+        # Score every input, summing each row in its own distribution order
+        score_rows = []
+        orders = []
+        totals = []
+        for user_input in user_inputs:
+            scores, order = self._intent_scores(user_input.lower())
+            score_rows.append(scores)
+            orders.append(order)
+            totals.append(sum([scores[row] for row in order]))
+
+        # Normalize all rows in one step
+        totals = np.array(totals)
+        probabilities = np.array(score_rows) / totals[:, np.newaxis]
+        for row in np.flatnonzero(totals <= 0):
+            # If no clear signals, assign equal probabilities
+            probabilities[row] = 1.0 / probabilities.shape[1]
+            orders[row] = list(range(probabilities.shape[1]))
+        probabilities.flags.writeable = False
+
+        return [
+            self._to_intent_analysis(self._intent_field_from_vector(
+                intent_vector,
+                order,
+                thresholds["ambiguity_threshold"],
+                thresholds["confidence_threshold"],
+                thresholds["clarification_threshold"]
+            ))
+            for intent_vector, order in zip(probabilities, orders)
+        ]
+
+    def _to_intent_analysis(self, intent_field: Tuple) -> IntentAnalysis:
+        """
+        Wrap a computed intent field in an IntentAnalysis and record it as current state.
+
+        Args:
+            intent_field: Tuple returned by _intent_field_from_vector
+
+        Returns:
+            IntentAnalysis object
+        """
+        (intent_vector, intent_order, confidence_regions, ambiguity_zones,
+         primary_intent, confidence_score, clarification_needed) = intent_field
+
+        # The vector is read-only and may be shared with the cache; hand out
+        # copies of the mutable containers so callers never alter cached results
+        self.intent_vector = intent_vector
+        self.intent_order = intent_order
+        self.confidence_regions = dict(confidence_regions)
+        self.ambiguity_zones = list(ambiguity_zones)
 
         # Create intent analysis result
-        intent_analysis = IntentAnalysis(
-            intent_distribution=self.intent_distributions,
+        return IntentAnalysis.from_vector(
+            intent_vector=intent_vector,
+            intent_labels=self.INTENT_CATEGORIES,
+            intent_order=intent_order,
             confidence_regions=self.confidence_regions,
             ambiguity_zones=self.ambiguity_zones,
             primary_intent=primary_intent,
@@ -313,8 +760,81 @@ class ProbabilisticIntentField:
             clarification_needed=clarification_needed
         )
 
-        logger.info(f"Generated intent field with primary intent: {primary_intent}, confidence: {confidence_score:.2f}")
-        return intent_analysis
+    @property
+    def intent_distributions(self) -> Dict[str, float]:
+        """Intent distribution of the most recent analysis, keyed by intent."""
+        values = self.intent_vector.tolist()
+        return {self.INTENT_CATEGORIES[row]: values[row] for row in self.intent_order}
+
+    def _compute_intent_field(self, normalized_input: str, ambiguity_threshold: float,
+                              confidence_threshold: float, clarification_threshold: float) -> Tuple[np.ndarray, Tuple[int, ...], Dict[str, float], Tuple[str, ...], str, float, bool]:
+        """
+        Compute the intent field for a normalized input; memoized per instance.
+
+        Args:
+            normalized_input: Lowercased user input
+            ambiguity_threshold: Threshold for flagging ambiguity zones
+            confidence_threshold: Threshold for high-certainty intents
+            clarification_threshold: Confidence below which clarification is needed
+
+        Returns:
+            Tuple of (read-only intent vector, rows in distribution order,
+            confidence regions, ambiguity zones, primary intent, confidence
+            score, clarification needed)
+        """
+        # Compute intent probabilities
+        intent_vector, order = self._intent_probability_vector(normalized_input)
+        intent_vector.flags.writeable = False
+        return self._intent_field_from_vector(
+            intent_vector, order, ambiguity_threshold, confidence_threshold, clarification_threshold
+        )
+
+    def _intent_field_from_vector(self, intent_vector: np.ndarray, order: Sequence[int], ambiguity_threshold: float,
+                                  confidence_threshold: float, clarification_threshold: float) -> Tuple[np.ndarray, Tuple[int, ...], Dict[str, float], Tuple[str, ...], str, float, bool]:
+        """
+        Derive confidence regions, ambiguity zones and the primary intent from a probability vector.
+
+        Args:
+            intent_vector: Read-only normalized probabilities by INTENT_CATEGORIES row
+            order: Rows in distribution order
+            ambiguity_threshold: Threshold for flagging ambiguity zones
+            confidence_threshold: Threshold for high-certainty intents
+            clarification_threshold: Confidence below which clarification is needed
+
+        Returns:
+            Intent field tuple as returned by _compute_intent_field
+        """
+        labels = self.INTENT_CATEGORIES
+        values = intent_vector.tolist()
+
+        # Identify high certainty areas using domain-specific threshold
+        confidence_regions = {
+            labels[row]: values[row]
+            for row in order
+            if values[row] >= confidence_threshold
+        }
+
+        # Get primary intent (first in distribution order on ties) and confidence score
+        primary_row = max(order, key=values.__getitem__)
+        primary_intent, confidence_score = labels[primary_row], values[primary_row]
+
+        # Flag uncertain regions using domain-specific threshold, skipping the
+        # sort entirely when the primary intent dominates
+        second_prob = max((values[row] for row in order if row != primary_row), default=0.0)
+        if self._primary_is_dominant(confidence_score, second_prob, ambiguity_threshold):
+            ambiguity_zones = []
+        else:
+            top_rows = sorted(order, key=values.__getitem__, reverse=True)[:5]
+            ambiguity_zones = self._ambiguity_zones(
+                [(labels[row], values[row]) for row in top_rows],
+                ambiguity_threshold
+            )
+
+        # Determine if clarification is needed using domain-specific threshold
+        clarification_needed = confidence_score < clarification_threshold or len(ambiguity_zones) > 0
+
+        return (intent_vector, tuple(order), confidence_regions, tuple(ambiguity_zones),
+                primary_intent, confidence_score, clarification_needed)
 
     def compute_intent_probabilities(self, user_input: str) -> Dict[str, float]:
         """
@@ -329,135 +849,143 @@ class ProbabilisticIntentField:
         # Normalize input
         normalized_input = user_input.lower()
 
-        # Initialize probabilities
-        probabilities = defaultdict(float)
+        probabilities, order = self._intent_probability_vector(normalized_input)
+        values = probabilities.tolist()
+        return {self.INTENT_CATEGORIES[row]: values[row] for row in order}
+
+    def _intent_probability_vector(self, normalized_input: str) -> Tuple[np.ndarray, List[int]]:
+        """
+        Compute the normalized intent probability vector.
+
+        Args:
+            normalized_input: Lowercased user input
+
+        Returns:
+            Tuple of (probabilities indexed by INTENT_CATEGORIES row, list of
+            rows in distribution order)
+        """
+        scores, order = self._intent_scores(normalized_input)
+
+        # Normalize probabilities to sum to 1, summing in distribution order
+        total = sum([scores[row] for row in order])
+        if total > 0:
+            probabilities = np.array(scores) / total
+        else:
+            # If no clear signals, assign equal probabilities
+            probabilities = np.full(len(scores), 1.0 / len(scores))
+            order = list(range(len(scores)))
+
+        return probabilities, order
+
+    def _intent_scores(self, normalized_input: str) -> Tuple[List[float], List[int]]:
+        """
+        Score keyword and sentence-structure signals for each intent.
+
+        Args:
+            normalized_input: Lowercased user input
+
+        Returns:
+            Tuple of (unnormalized scores indexed by INTENT_CATEGORIES row,
+            rows in distribution order)
+        """
+        n_intents = len(self.INTENT_CATEGORIES)
 
         # Adjust weights for different signals
         keyword_weight = 0.7  # Prioritize explicit keywords
         structure_weight = 0.3  # Complementary weight for sentence structure
 
-        # Enhanced keyword matching with boosting for exact matches
-        for intent, keywords in self.INTENT_KEYWORDS.items():
-            # Count keyword matches with boosting for exact matches
-            matches = 0
-            exact_matches = 0
-
-            # Check for exact phrase matches (higher weight)
-            words = normalized_input.split()
-            for keyword in keywords:
-                if keyword in normalized_input:
-                    matches += 1
-                    # Check for exact matches (whole word or phrase)
-                    if keyword in words or f" {keyword} " in f" {normalized_input} ":
-                        exact_matches += 1
-
-            # Calculate base probability with boosting for exact matches
-            if matches > 0:
+        # Find every keyword occurring in the input, in a single pass when the
+        # Aho-Corasick automaton is available
+        if self._KEYWORD_AUTOMATON is not None:
+            found_keywords = {match for _, match in self._KEYWORD_AUTOMATON.iter(normalized_input)}
+        else:
+            found_keywords = [
+                matcher for keyword, matcher in self._KEYWORD_MATCHERS.items()
+                if keyword in normalized_input
+            ]
+
+        # Count matched and exactly matched keywords per intent row
+        matches = defaultdict(int)
+        exact_matches = defaultdict(int)
+        words = set(normalized_input.split())
+        padded_input = f" {normalized_input} "
+        for rows, is_single_word, exact_probe in found_keywords:
+            # Check for exact matches (whole word or phrase)
+            is_exact = exact_probe in words if is_single_word else exact_probe in padded_input
+            for row in rows:
+                matches[row] += 1
+                if is_exact:
+                    exact_matches[row] += 1
+
+        # Accumulate into a fixed-layout score vector; order records the rows
+        # in the order the previous dict-based version inserted them
+        scores = [0.0] * n_intents
+        order = []
+        for row in self._KEYWORD_ORDER:
+            row_matches = matches.get(row)
+            if row_matches:
                 # Base probability from keyword matches
-                base_prob = matches / len(keywords)
+                base_prob = row_matches * self._INV_KEYWORD_COUNTS[row]
                 # Boost for exact matches
-                exact_match_boost = 0.5 * (exact_matches / max(1, matches))
+                exact_match_boost = self._EXACT_MATCH_BOOST * (exact_matches.get(row, 0) / row_matches)
                 # Apply weighted probability with boost
-                probabilities[intent] += keyword_weight * (base_prob + exact_match_boost)
+                scores[row] = keyword_weight * (base_prob + exact_match_boost)
+                order.append(row)
 
         # Analyze sentence structure for additional intent signals
-        structure_probabilities = self._analyze_sentence_structure(normalized_input, defaultdict(float))
+        structure_probabilities = self._analyze_sentence_structure(normalized_input, defaultdict(float), words)
 
         # Combine keyword and structure probabilities with appropriate weights
         for intent, prob in structure_probabilities.items():
-            probabilities[intent] += structure_weight * prob
+            row = self._INTENT_INDEX[intent]
+            if row not in matches:
+                order.append(row)
+            scores[row] += structure_weight * prob
 
         # Ensure all intent categories have a value
-        for intent in self.INTENT_CATEGORIES:
-            if intent not in probabilities:
-                probabilities[intent] = 0.01  # Small baseline probability
+        for row in range(n_intents):
+            if not scores[row]:
+                scores[row] = 0.01  # Small baseline probability
+                order.append(row)
 
-        # Normalize probabilities to sum to 1
-        total = sum(probabilities.values())
-        if total > 0:
-            normalized_probabilities = {intent: prob/total for intent, prob in probabilities.items()}
-        else:
-            # If no clear signals, assign equal probabilities
-            normalized_probabilities = {intent: 1.0/len(self.INTENT_CATEGORIES) for intent in self.INTENT_CATEGORIES}
+        return scores, order
 
-        return normalized_probabilities
-
-    def _analyze_sentence_structure(self, text: str, probabilities: Dict[str, float]) -> Dict[str, float]:
+    def _analyze_sentence_structure(self, text: str, probabilities: Dict[str, float],
+                                    words: Optional[Set[str]] = None) -> Dict[str, float]:
         """
         Analyze sentence structure for additional intent signals.
 
         Args:
             text: Normalized user input
             probabilities: Current probability distribution
+            words: Optional set of the input's whitespace tokens, if already computed
 
         Returns:
             Updated probability distribution
         """
         # Check for question structure - strong indicator of information request
         if text.endswith("?"):
-            if any(word in text for word in ["what", "who", "where", "when", "why", "how"]):
+            if any(word in text for word in _QUESTION_WORDS):
                 probabilities["information_request"] += 0.8  # Increased for stronger signal
-            elif "is" in text.split() or "are" in text.split() or "am" in text.split():
-                probabilities["factual_verification"] += 0.7  # Increased for stronger signal
+            else:
+                if words is None:
+                    words = set(text.split())
+                if "is" in words or "are" in words or "am" in words:
+                    probabilities["factual_verification"] += 0.7  # Increased for stronger signal
 
         # Check for imperative structure (commands/requests)
-        sentences = re.split(r'[.!?]', text)
-        for sentence in sentences:
-            words = sentence.strip().split()
-            if words and words[0] in ["create", "generate", "write", "make", "build", "develop", "implement"]:
+        for sentence in _SENT_SPLIT_RE.split(text):
+            # Only the first word decides, so split off just that one
+            words = sentence.split(None, 1)
+            if words and words[0] in _IMPERATIVE_VERBS:
                 probabilities["action_request"] += 0.6  # Increased for stronger signal
 
-                # Check for code-related imperatives - very strong signal
-                if any(word in sentence for word in ["code", "function", "program", "algorithm", "class", "module"]):
-                    probabilities["code_generation"] += 0.9  # Increased for stronger signal
-
-                # Check for creative imperatives - very strong signal
-                if any(word in sentence for word in ["story", "poem", "creative", "imagine", "fiction", "narrative"]):
-                    probabilities["creative_generation"] += 0.9  # Increased for stronger signal
-
-                # Check for data visualization imperatives - new strong signal
-                if any(word in sentence for word in ["visualization", "chart", "graph", "plot", "dashboard", "diagram"]):
-                    probabilities["data_visualization"] += 0.9  # New strong signal
-
-                # Check for educational content imperatives - new strong signal
-                if any(word in sentence for word in ["lesson", "course", "tutorial", "educational", "teaching"]):
-                    probabilities["educational_content"] += 0.9  # New strong signal
-
-        # Check for comparison structure - very specific intent
-        if any(phrase in text for phrase in ["compare", "difference between", "versus", "vs", "pros and cons", "similarities", "differences"]):
-            probabilities["comparison"] += 0.9  # Increased for stronger signal
-
-        # Check for problem-solving structure
-        if any(phrase in text for phrase in ["how to", "how do i", "help me", "solve", "fix", "troubleshoot", "debug"]):
-            probabilities["problem_solving"] += 0.8  # Increased for stronger signal
+                # Check for code, creative, visualization and educational imperatives
+                _apply_phrase_rules(_IMPERATIVE_RULES, _IMPERATIVE_AUTOMATON, sentence, probabilities)
 
-        # Check for explanation requests
-        if any(phrase in text for phrase in ["explain", "clarify", "describe", "elaborate on", "tell me about"]):
-            probabilities["explanation"] += 0.8  # Increased for stronger signal
-
-        # Check for summarization requests
-        if any(phrase in text for phrase in ["summarize", "summary", "overview", "tldr", "in brief"]):
-            probabilities["summarization"] += 0.9  # Increased for stronger signal
-
-        # Check for analysis requests
-        if any(phrase in text for phrase in ["analyze", "analysis", "examine", "investigate", "evaluate"]):
-            probabilities["analysis"] += 0.8  # Increased for stronger signal
-
-        # Check for data analysis requests
-        if any(phrase in text for phrase in ["analyze data", "data analysis", "statistics", "metrics", "trends", "patterns"]):
-            probabilities["data_analysis"] += 0.9  # New strong signal
-
-        # Check for data visualization requests
-        if any(phrase in text for phrase in ["visualize data", "data visualization", "chart", "graph", "plot"]):
-            probabilities["data_visualization"] += 0.9  # New strong signal
-
-        # Check for research requests
-        if any(phrase in text for phrase in ["research", "literature review", "academic research", "scientific inquiry"]):
-            probabilities["research"] += 0.9  # New strong signal
-
-        # Check for recommendation requests
-        if any(phrase in text for phrase in ["recommend", "what's the best", "suggest", "advice", "should I"]):
-            probabilities["recommendation"] += 0.9  # New strong signal
+        # Check for comparison, problem-solving, explanation, summarization,
+        # analysis, data, research and recommendation phrasing
+        _apply_phrase_rules(_STRUCTURE_RULES, _STRUCTURE_AUTOMATON, text, probabilities)
 
         return probabilities
 
@@ -498,45 +1026,85 @@ class ProbabilisticIntentField:
         # Use provided threshold or fall back to instance default
         threshold = ambiguity_threshold if ambiguity_threshold is not None else self.ambiguity_threshold
 
-        # Sort intents by probability (descending)
-        sorted_intents = sorted(intent_distribution.items(), key=lambda x: x[1], reverse=True)
+        # No zone can form when the primary intent dominates
+        top_two = heapq.nlargest(2, intent_distribution.values())
+        if len(top_two) == 2 and self._primary_is_dominant(top_two[0], top_two[1], threshold):
+            return []
+
+        # Only the five most probable intents can form ambiguity zones
+        top_intents = sorted(intent_distribution.items(), key=itemgetter(1), reverse=True)[:5]
+        return self._ambiguity_zones(top_intents, threshold)
+
+    @staticmethod
+    def _primary_is_dominant(top_prob: float, second_prob: float, threshold: float) -> bool:
+        """
+        Check whether the top two probabilities rule out every ambiguity zone.
+
+        The top pair must clear the ambiguity test and the runner-up must be too
+        small for the secondary pair checks (which require a probability above 0.15).
 
-        # Check for ambiguity (multiple intents with similar probabilities)
+        Args:
+            top_prob: Highest probability
+            second_prob: Second-highest probability
+            threshold: Ambiguity threshold
+
+        Returns:
+            True if _ambiguity_zones would return no zones
+        """
+        return top_prob >= 0.4 and top_prob - second_prob >= threshold and second_prob <= 0.15
+
+    def _ambiguity_zones(self, top_intents: List[Tuple[str, float]], threshold: float) -> List[str]:
+        """
+        Build ambiguity zones from the most probable intents.
+
+        Args:
+            top_intents: Up to five (intent, probability) pairs, most probable first
+            threshold: Ambiguity threshold
+
+        Returns:
+            List of ambiguity zones in the order they were found
+        """
+        # Check for ambiguity (multiple intents with similar probabilities);
+        # zones keep first-seen order, the set only answers membership
         ambiguity_zones = []
+        seen_zones = set()
+        zone_names = self._ZONE_NAMES
+
+        def add_zone(intent_a: str, intent_b: str) -> None:
+            # Zone names join the pair in sorted order to avoid duplicates
+            zone = zone_names.get((intent_a, intent_b))
+            if zone is None:
+                zone = "_".join(sorted((intent_a, intent_b)))
+            if zone not in seen_zones:
+                seen_zones.add(zone)
+                ambiguity_zones.append(zone)
 
         # If we have at least 2 intents
-        if len(sorted_intents) >= 2:
+        if len(top_intents) >= 2:
             # Check if top two intents have similar probabilities
-            top_intent, top_prob = sorted_intents[0]
-            second_intent, second_prob = sorted_intents[1]
+            top_intent, top_prob = top_intents[0]
+            second_intent, second_prob = top_intents[1]
 
             # If the difference is less than the threshold, or if the top probability is low
             if top_prob - second_prob < threshold or top_prob < 0.4:
-                # Create a new ambiguity zone with sorted intents to avoid duplicates
-                new_zone = "_".join(sorted([top_intent, second_intent]))
-                ambiguity_zones.append(new_zone)
+                add_zone(top_intent, second_intent)
 
                 # Also check if there's a third intent close to the second
-                if len(sorted_intents) >= 3:
-                    third_intent, third_prob = sorted_intents[2]
+                if len(top_intents) >= 3:
+                    third_intent, third_prob = top_intents[2]
                     if second_prob - third_prob < threshold:
-                        # Create a new ambiguity zone with sorted intents to avoid duplicates
-                        new_zone = "_".join(sorted([second_intent, third_intent]))
-                        if new_zone not in ambiguity_zones:
-                            ambiguity_zones.append(new_zone)
+                        add_zone(second_intent, third_intent)
 
             # Check for additional ambiguity with other high-probability intents
             # This helps catch cases where multiple intents have similar probabilities
-            for i in range(1, min(4, len(sorted_intents))):
-                intent_i, prob_i = sorted_intents[i]
-                if prob_i > 0.15:  # Only consider intents with reasonable probability
-                    for j in range(i+1, min(5, len(sorted_intents))):
-                        intent_j, prob_j = sorted_intents[j]
-                        if prob_j > 0.1 and prob_i - prob_j < threshold:
-                            # Create a new ambiguity zone with sorted intents to avoid duplicates
-                            new_zone = "_".join(sorted([intent_i, intent_j]))
-                            if new_zone not in ambiguity_zones:
-                                ambiguity_zones.append(new_zone)
+            for i, j in _AMBIGUITY_PAIRS:
+                if j >= len(top_intents):
+                    continue
+                intent_i, prob_i = top_intents[i]
+                intent_j, prob_j = top_intents[j]
+                # Only consider intents with reasonable probability
+                if prob_i > 0.15 and prob_j > 0.1 and prob_i - prob_j < threshold:
+                    add_zone(intent_i, intent_j)
 
         return ambiguity_zones
 
@@ -550,122 +1118,38 @@ class ProbabilisticIntentField:
         Returns:
             Dictionary with clarification strategy
         """
+        clarification_questions = []
         clarification_strategy = {
             "needs_clarification": len(ambiguity_zones) > 0,
             "ambiguity_zones": ambiguity_zones,
-            "clarification_questions": []
+            "clarification_questions": clarification_questions
         }
 
         # Generate specific clarification questions for each ambiguity zone
         # Use a set to track which ambiguity pairs we've already processed
         processed_pairs = set()
 
+        zone_clarifications = self._ZONE_CLARIFICATIONS
         for zone in ambiguity_zones:
-            intents = zone.split("_")
-
-            if len(intents) == 2:
-                intent1, intent2 = intents
-
-                # Create a sorted tuple of intents to use as a key
-                intent_key = tuple(sorted([intent1, intent2]))
-
-                # Skip if we've already processed this pair
-                if intent_key in processed_pairs:
-                    continue
-
-                # Mark this pair as processed
-                processed_pairs.add(intent_key)
-
-                # Create a sorted pair of intents to handle them regardless of order
-                intent_pair = tuple(sorted([intent1, intent2]))
-
-                # Generate appropriate clarification question based on the ambiguous intents
-                if intent_pair == ("action_request", "information_request"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Are you looking for information about this topic, or do you want me to create something specific?"
-                    )
-                elif intent_pair == ("code_generation", "creative_generation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to write creative content, or are you looking for code implementation?"
-                    )
-                elif intent_pair == ("factual_verification", "opinion"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Are you asking for my opinion on this matter, or would you like me to verify factual information?"
-                    )
-                elif intent_pair == ("explanation", "problem_solving"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to help solve this problem, or would you prefer an explanation of how it works?"
-                    )
-                elif intent_pair == ("analysis", "comparison"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to compare these items directly, or provide a deeper analysis of each one?"
-                    )
-                elif intent_pair == ("explanation", "summarization"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like a concise summary, or a more detailed explanation with context and reasoning?"
-                    )
-                elif intent_pair == ("data_analysis", "visualization"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to analyze the data and provide insights, or create visualizations of the data?"
-                    )
-                elif intent_pair == ("comparison", "recommendation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to recommend the best option for you, or provide a detailed comparison of all options?"
-                    )
-                elif intent_pair == ("debugging", "explanation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to help debug this issue and find a solution, or explain why this issue might be occurring?"
-                    )
-                elif intent_pair == ("brainstorming", "planning"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to help create a structured plan, or generate creative ideas and possibilities?"
-                    )
-                elif intent_pair == ("data_analysis", "data_visualization"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to analyze the data to find insights, or create visual representations of the data?"
-                    )
-                elif intent_pair == ("educational_content", "explanation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to create structured educational materials, or provide an explanation of this topic?"
-                    )
-                elif intent_pair == ("analysis", "research"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to conduct research on this topic, or analyze existing information?"
-                    )
-                elif intent_pair == ("action_request", "data_visualization"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to create a visualization of data, or are you asking me to perform a different action?"
-                    )
-                elif intent_pair == ("action_request", "creative_generation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to perform a specific action, or create something creative for you?"
-                    )
-                elif intent_pair == ("information_request", "recommendation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Are you looking for factual information, or would you like me to provide a recommendation?"
-                    )
-                elif intent_pair == ("code_generation", "problem_solving"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to write code for you, or help you solve a problem without necessarily writing code?"
-                    )
-                elif intent_pair == ("educational_content", "information_request"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to create structured educational content, or just provide specific information?"
-                    )
-                elif intent_pair == ("action_request", "code_generation"):
-                    clarification_strategy["clarification_questions"].append(
-                        "Would you like me to write code for you, or perform some other action?"
-                    )
-                else:
-                    # Generic clarification for other ambiguity pairs
-                    clarification_strategy["clarification_questions"].append(
-                        f"I'm not sure if you're looking for {intent1.replace('_', ' ')} or {intent2.replace('_', ' ')}. Could you clarify?"
-                    )
+            if zone in zone_clarifications:
+                clarification = zone_clarifications[zone]
+            else:
+                clarification = _zone_clarification(zone)
+            if clarification is None:
+                continue
+
+            # Skip if we've already processed this pair, in either order
+            intent_pair, question = clarification
+            if intent_pair in processed_pairs:
+                continue
+            processed_pairs.add(intent_pair)
+            clarification_questions.append(question)
 
         # Log the clarification strategy for debugging
-        logger.info(f"Generated clarification strategy: needs_clarification={clarification_strategy['needs_clarification']}, "
-                   f"questions={clarification_strategy['clarification_questions']}, "
-                   f"ambiguity_zones={clarification_strategy['ambiguity_zones']}")
+        logger.info("Generated clarification strategy: needs_clarification=%s, questions=%s, ambiguity_zones=%s",
+                    clarification_strategy["needs_clarification"],
+                    clarification_strategy["clarification_questions"],
+                    clarification_strategy["ambiguity_zones"])
 
         return clarification_strategy
 
@@ -687,6 +1171,92 @@ class ProbabilisticIntentField:
         return primary_intent[0], primary_intent[1]
 
 
+# Confidence boosts for intents that typically get lower (0.15) or moderate (0.1) scores
+_CONFIDENCE_BOOSTS = {
+    **dict.fromkeys(("comparison", "brainstorming", "code_generation",
+                     "educational_content", "explanation", "action_request"), 0.15),
+    **dict.fromkeys(("data_visualization", "data_analysis", "research",
+                     "recommendation", "problem_solving"), 0.1),
+}
+
+
+class PersistentIntentCache:
+    """
+    Write-through SQLite store for intent analyses.
+
+    Backs the in-memory cache of IntentAnalyzer so analyses survive restarts
+    and are shared between worker processes using the same file. Analyses are
+    stored as JSON of IntentAnalysis.to_dict(), under keys prefixed with the
+    storage format version and a namespace, so rows written by an older
+    format or intent model are never read back.
+    """
+
+    # Bump whenever the stored representation changes
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path: str, namespace: str = ""):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Path of the SQLite database file
+            namespace: Identifies the intent model whose analyses are stored
+        """
+        self.path = path
+        self.namespace = namespace
+        self._key_prefix = f"v{self.SCHEMA_VERSION}:{namespace}:".encode("utf-8")
+        # The connection is shared by all threads of the analyzer, one statement at a time
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS intent_cache "
+            "(key BLOB PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: bytes) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Load a stored analysis that has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (analysis dictionary, expiry time), or None if the key is not stored or has expired
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM intent_cache WHERE key = ? AND expires_at > ?",
+                (self._key_prefix + key, time.time())
+            ).fetchone()
+        return (json.loads(row[0]), row[1]) if row is not None else None
+
+    def set(self, key: bytes, data: Dict[str, Any], expires_at: float = math.inf):
+        """
+        Store an analysis, replacing any previous one for the key.
+
+        Args:
+            key: Cache key
+            data: Analysis dictionary, as returned by IntentAnalysis.to_dict()
+            expires_at: Time (as from time.time()) after which the analysis is stale
+        """
+        value = json.dumps(data)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO intent_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (self._key_prefix + key, value, expires_at)
+            )
+
+    def clear(self):
+        """Remove all stored analyses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM intent_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM intent_cache").fetchone()[0]
+
+
 class IntentAnalyzer:
     """
     Analyzes user intents using probabilistic intent fields.
@@ -709,13 +1279,68 @@ class IntentAnalyzer:
         # Initialize cache
         self.cache_size = self.config.get("cache_size", 1000)
         self.cache_enabled = self.config.get("cache_enabled", True)
-        self.cache = {}
+        self.cache = OrderedDict()
+        # Entries expire after cache_ttl_seconds so analyses from an outdated
+        # intent model do not linger; None keeps them until evicted
+        self.cache_ttl = self.config.get("cache_ttl_seconds", 3600)
+
+        # Cache statistics; updated under a lock so concurrent requests never lose counts
+        self._stats_lock = threading.Lock()
         self.cache_hits = 0
         self.cache_misses = 0
 
-        logger.debug(f"Initialized IntentAnalyzer with cache {'enabled' if self.cache_enabled else 'disabled'}, size: {self.cache_size}")
+        # Opt-in frequency admission lets popular prompts survive bursts of
+        # one-off prompts: a new entry only displaces the least recently used
+        # one if it has been requested at least as often
+        self.cache_frequency_admission = self.config.get("cache_frequency_admission", False)
+        self._access_counts = Counter()
+        self.cache_rejections = 0
+
+        # Optional persistent second tier behind the in-memory cache
+        self.cache_backend = self.config.get("cache_backend", "memory")
+        if self.cache_backend == "sqlite":
+            self.persistent_cache = PersistentIntentCache(
+                self.config.get("cache_path", "intent_cache.sqlite3"),
+                namespace=self._persistent_cache_namespace()
+            )
+        elif self.cache_backend == "memory":
+            self.persistent_cache = None
+        else:
+            raise ValueError(f"Invalid cache backend: {self.cache_backend}")
+        self.persistent_hits = 0
+
+        # Opt-in fast path returning the previous result when called again with
+        # the very same prompt object; it skips key hashing, the lookup and
+        # frequency tracking, so recency and admission see fewer accesses
+        self.unsafe_fastpath = self.cache_enabled and self.config.get(
+            "unsafe_fastpath",
+            os.environ.get("ANALYZE_UNSAFE_FASTPATH", "").lower() in ("1", "true", "yes")
+        )
+        self._last_call = None
 
-    def _get_cache_key(self, prompt: str, domain: Optional[str] = None) -> str:
+        logger.debug("Initialized IntentAnalyzer with cache %s, size: %s",
+                     "enabled" if self.cache_enabled else "disabled", self.cache_size)
+
+    def _persistent_cache_namespace(self) -> str:
+        """
+        Namespace for persistent cache keys.
+
+        Combines the configured cache_namespace (bump it when the analysis logic
+        changes) with a fingerprint of the intent categories, keywords and
+        domain thresholds, so a different intent model never reads stale rows.
+
+        Returns:
+            Namespace string
+        """
+        field_generator = self.intent_field_generator
+        model = json.dumps(
+            [field_generator.INTENT_CATEGORIES, field_generator.INTENT_KEYWORDS, field_generator.domain_thresholds],
+            sort_keys=True, default=str
+        )
+        fingerprint = hashlib.blake2b(model.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{self.config.get('cache_namespace', '')}:{fingerprint}"
+
+    def _get_cache_key(self, prompt: str, domain: Optional[str] = None) -> bytes:
         """
         Generate a cache key for a prompt and domain.
 
@@ -724,41 +1349,155 @@ class IntentAnalyzer:
             domain: Optional domain for domain-specific thresholds
 
         Returns:
-            A string cache key
+            A 16-byte digest of the normalized prompt and domain
         """
-        # Normalize the prompt for better cache hits
-        normalized_prompt = prompt.lower().strip()
+        # Normalize the prompt for better cache hits; prompts that are already
+        # lowercase and stripped are used as they are
+        if prompt.islower() and not (prompt[:1].isspace() or prompt[-1:].isspace()):
+            normalized_prompt = prompt
+        else:
+            normalized_prompt = prompt.lower().strip()
 
-        # Create a cache key that includes the domain if provided
+        # Hash to a fixed-size key so long prompts are neither stored nor rehashed;
+        # the domain is included if provided
+        key_hash = hashlib.blake2b(normalized_prompt.encode("utf-8"), digest_size=16)
         if domain:
-            return f"{normalized_prompt}::{domain}"
-        else:
-            return normalized_prompt
+            key_hash.update(b"\x00")
+            key_hash.update(domain.encode("utf-8"))
+        return key_hash.digest()
+
+    def _record_access(self, cache_key: bytes):
+        """Count a request for a cache key, halving all counts once too many keys are tracked."""
+        access_counts = self._access_counts
+        access_counts[cache_key] += 1
+        if len(access_counts) > 4 * self.cache_size:
+            # Age the counts so stale popularity fades and the counter stays bounded
+            self._access_counts = Counter({
+                key: count >> 1 for key, count in access_counts.items() if count > 1
+            })
+
+    def _admit_to_cache(self, cache_key: bytes) -> bool:
+        """
+        Decide whether a new entry may be cached.
+
+        Args:
+            cache_key: Key of the entry to insert
+
+        Returns:
+            True if the entry should be cached
+        """
+        if not self.cache_frequency_admission or not self.cache or len(self.cache) < self.cache_size:
+            return True
+
+        # Compare against the entry that would be evicted to make room
+        victim_key = next(iter(self.cache))
+        if self._access_counts[cache_key] >= self._access_counts[victim_key]:
+            return True
+        with self._stats_lock:
+            self.cache_rejections += 1
+        return False
 
     def _manage_cache_size(self):
         """Ensure the cache doesn't exceed the maximum size."""
-        if len(self.cache) > self.cache_size:
-            # Remove 20% of the oldest entries
-            entries_to_remove = int(self.cache_size * 0.2)
-            keys_to_remove = list(self.cache.keys())[:entries_to_remove]
-            for key in keys_to_remove:
-                del self.cache[key]
-            logger.info(f"Cache pruned, removed {entries_to_remove} entries")
+        # Evict least recently used entries, which sit at the front of the cache
+        entries_removed = 0
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+            entries_removed += 1
+        if entries_removed:
+            logger.debug("Cache pruned, removed %d entries", entries_removed)
 
     def clear_cache(self):
         """Clear the intent analysis cache."""
         cache_size = len(self.cache)
-        self.cache = {}
-        logger.info(f"Intent analysis cache cleared, removed {cache_size} entries")
+        self.cache = OrderedDict()
+        self._access_counts = Counter()
+        self._last_call = None
+        self.intent_field_generator._cached_intent_field.cache_clear()
+        if self.persistent_cache is not None:
+            try:
+                self.persistent_cache.clear()
+            except sqlite3.Error as e:
+                self._disable_persistent_cache(e)
+        logger.info("Intent analysis cache cleared, removed %d entries", cache_size)
+
+    def _disable_persistent_cache(self, error: Exception):
+        """Stop using the persistent cache after a storage error."""
+        logger.warning("Persistent intent cache failed, falling back to memory only: %s", error)
+        self.persistent_cache = None
+
+    def _cache_expiry(self) -> float:
+        """Expiry time for an entry cached now."""
+        if not self.cache_ttl:
+            return math.inf
+        return time.time() + self.cache_ttl
+
+    def _load_persistent(self, cache_key: bytes) -> Optional[Tuple[IntentAnalysis, float]]:
+        """
+        Load an analysis from the persistent cache.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Tuple of (IntentAnalysis, expiry time), or None if it is not stored or has expired
+        """
+        try:
+            stored = self.persistent_cache.get(cache_key)
+            if stored is None:
+                return None
+            data, expires_at = stored
+            # Lay the analysis out over the field's own label list so it can use the vector fast paths
+            intent_analysis = IntentAnalysis.from_dict(data, self.intent_field_generator.INTENT_CATEGORIES)
+        except sqlite3.Error as e:
+            self._disable_persistent_cache(e)
+            return None
+        except Exception as e:
+            # A malformed or incompatible row only costs a recomputation
+            logger.warning("Ignoring unreadable persistent intent cache entry: %s", e)
+            return None
+        return intent_analysis, expires_at
+
+    def _store_persistent(self, cache_key: bytes, intent_analysis: IntentAnalysis, expires_at: float):
+        """
+        Write an analysis through to the persistent cache.
+
+        Args:
+            cache_key: Cache key
+            intent_analysis: Analysis to store
+            expires_at: Expiry time of the analysis
+        """
+        try:
+            self.persistent_cache.set(cache_key, intent_analysis.to_dict(), expires_at)
+        except sqlite3.Error as e:
+            self._disable_persistent_cache(e)
+        except (TypeError, ValueError) as e:
+            logger.warning("Could not store intent analysis in the persistent cache: %s", e)
+
+    def warmup(self, prompts: List[str], domain: Optional[str] = None):
+        """
+        Prefill the cache with analyses of the given prompts.
+
+        Args:
+            prompts: Prompts expected to be requested
+            domain: Optional domain for domain-specific thresholds
+        """
+        for prompt in prompts:
+            self.analyze_intent(prompt, domain)
+        logger.info("Intent analysis cache warmed up with %d prompts", len(prompts))
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about the cache usage."""
+        cache_hits = self.cache_hits
+        cache_misses = self.cache_misses
         return {
             "cache_size": len(self.cache),
             "max_cache_size": self.cache_size,
-            "cache_hits": self.cache_hits,
-            "cache_misses": self.cache_misses,
-            "hit_ratio": self.cache_hits / (self.cache_hits + self.cache_misses) if (self.cache_hits + self.cache_misses) > 0 else 0
+            "cache_hits": cache_hits,
+            "cache_misses": cache_misses,
+            "cache_rejections": self.cache_rejections,
+            "persistent_hits": self.persistent_hits,
+            "hit_ratio": cache_hits / (cache_hits + cache_misses) if (cache_hits + cache_misses) > 0 else 0
         }
 
     def analyze_intent(self, prompt: str, domain: Optional[str] = None) -> IntentAnalysis:
@@ -772,20 +1511,95 @@ class IntentAnalyzer:
         Returns:
             IntentAnalysis object with intent information
         """
+        # Repeat call with the same prompt object: return the last result as-is
+        last_call = self._last_call
+        if (last_call is not None and prompt is last_call[0] and domain == last_call[1]
+                and time.time() < last_call[2][1]):
+            with self._stats_lock:
+                self.cache_hits += 1
+            return last_call[2][0]
+
+        # Logging is only paid for when debug output is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Check cache first if enabled
         if self.cache_enabled:
             cache_key = self._get_cache_key(prompt, domain)
-            if cache_key in self.cache:
-                self.cache_hits += 1
-                logger.info(f"Intent analysis cache hit ({self.cache_hits} hits, {self.cache_misses} misses)")
-                return self.cache[cache_key]
+            if self.cache_frequency_admission:
+                self._record_access(cache_key)
+            cache_entry = self.cache.get(cache_key)
+            if cache_entry is not None and time.time() < cache_entry[1]:
+                intent_analysis = cache_entry[0]
+                with self._stats_lock:
+                    self.cache_hits += 1
+                # Mark the entry as most recently used, unless another thread
+                # has evicted it since the lookup
+                try:
+                    self.cache.move_to_end(cache_key)
+                except KeyError:
+                    pass
+                if debug:
+                    logger.debug("Intent analysis cache hit (%d hits, %d misses)", self.cache_hits, self.cache_misses)
+                if self.unsafe_fastpath:
+                    self._last_call = (prompt, domain, cache_entry)
+                return intent_analysis
+            if cache_entry is not None:
+                # Drop the expired entry; it is replaced below
+                self.cache.pop(cache_key, None)
+
+            # Fall back to the persistent cache before computing
+            if self.persistent_cache is not None:
+                stored = self._load_persistent(cache_key)
+                if stored is not None:
+                    intent_analysis = stored[0]
+                    with self._stats_lock:
+                        self.cache_hits += 1
+                        self.persistent_hits += 1
+                    if self._admit_to_cache(cache_key):
+                        self.cache[cache_key] = stored
+                        self._manage_cache_size()
+                    if debug:
+                        logger.debug("Intent analysis persistent cache hit (%d hits, %d misses)",
+                                     self.cache_hits, self.cache_misses)
+                    if self.unsafe_fastpath:
+                        self._last_call = (prompt, domain, stored)
+                    return intent_analysis
 
             # Cache miss, increment counter
-            self.cache_misses += 1
-            logger.info(f"Analyzing intent for prompt: {prompt[:50]}... (cache miss, {self.cache_hits} hits, {self.cache_misses} misses)")
-        else:
-            logger.info(f"Analyzing intent for prompt: {prompt[:50]}... (caching disabled)")
+            with self._stats_lock:
+                self.cache_misses += 1
+            if debug:
+                logger.debug("Analyzing intent for prompt: %.50s... (cache miss, %d hits, %d misses)",
+                             prompt, self.cache_hits, self.cache_misses)
+        elif debug:
+            logger.debug("Analyzing intent for prompt: %.50s... (caching disabled)", prompt)
+
+        intent_analysis = self._analyze_intent_uncached(prompt, domain)
 
+        # Cache the result if enabled, under the key computed for the lookup
+        if self.cache_enabled:
+            expires_at = self._cache_expiry()
+            if self._admit_to_cache(cache_key):
+                self.cache[cache_key] = (intent_analysis, expires_at)
+                self._manage_cache_size()
+            if self.persistent_cache is not None:
+                self._store_persistent(cache_key, intent_analysis, expires_at)
+            if self.unsafe_fastpath:
+                self._last_call = (prompt, domain, (intent_analysis, expires_at))
+
+        return intent_analysis
+
+    def _analyze_intent_uncached(self, prompt: str, domain: Optional[str] = None) -> IntentAnalysis:
+        """
+        Analyze the intent of a user prompt without consulting the cache.
+
+        Args:
+            prompt: The user's query or prompt
+            domain: Optional domain for domain-specific thresholds
+
+        Returns:
+            IntentAnalysis object with intent information
+        """
         # Generate intent field with domain-specific thresholds
         intent_analysis = self.intent_field_generator.generate_intent_field(prompt, domain)
 
@@ -795,13 +1609,9 @@ class IntentAnalyzer:
         # Update confidence score in the analysis
         intent_analysis.confidence_score = confidence_score
 
-        # Cache the result if enabled
-        if self.cache_enabled:
-            cache_key = self._get_cache_key(prompt, domain)
-            self.cache[cache_key] = intent_analysis
-            self._manage_cache_size()
-
-        logger.info(f"Intent analysis complete. Primary intent: {intent_analysis.primary_intent}, Confidence: {confidence_score:.2f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Intent analysis complete. Primary intent: %s, Confidence: %.2f",
+                         intent_analysis.primary_intent, confidence_score)
         return intent_analysis
 
     def verify_alignment(self, original_intent: IntentAnalysis, response: str) -> bool:
@@ -821,10 +1631,13 @@ class IntentAnalyzer:
         response_intent = self.intent_field_generator.generate_intent_field(response)
 
         # Calculate similarity between original intent distribution and response intent distribution
-        similarity_score = self._calculate_intent_similarity(
-            original_intent.intent_distribution,
-            response_intent.intent_distribution
-        )
+        if self._uses_field_vector(original_intent):
+            similarity_score = self._cosine_similarity(original_intent.intent_vector, response_intent.intent_vector)
+        else:
+            similarity_score = self._calculate_intent_similarity(
+                original_intent.intent_distribution,
+                response_intent.intent_distribution
+            )
 
         # Check if primary intents match
         primary_intent_match = original_intent.primary_intent == response_intent.primary_intent
@@ -835,7 +1648,60 @@ class IntentAnalyzer:
         # Determine if alignment is sufficient
         is_aligned = alignment_score >= self.min_confidence_threshold
 
-        logger.info(f"Intent alignment verification: {is_aligned} (score: {alignment_score:.2f})")
+        logger.info("Intent alignment verification: %s (score: %.2f)", is_aligned, alignment_score)
+        return is_aligned
+
+    def verify_alignment_batch(self, original_intent: IntentAnalysis, responses: List[str]) -> np.ndarray:
+        """
+        Verify alignment between an original intent and many responses.
+
+        Responses are analyzed as one batch and compared to the original
+        intent with a single matrix-vector product; results match calling
+        verify_alignment on each response up to floating-point rounding.
+
+        Args:
+            original_intent: Original intent analysis
+            responses: Responses to check against original intent
+
+        Returns:
+            Boolean array indicating, per response, whether it aligns with the original intent
+        """
+        logger.info("Verifying intent alignment for %d responses...", len(responses))
+
+        # Analyze the responses as if they were prompts
+        response_intents = self.intent_field_generator.generate_intent_field_batch(responses)
+        if not response_intents:
+            return np.zeros(0, dtype=bool)
+
+        # Calculate similarity between the original intent and every response intent
+        if self._uses_field_vector(original_intent):
+            original_vector = original_intent.intent_vector
+            response_vectors = np.array([response_intent.intent_vector for response_intent in response_intents])
+            norms = np.sqrt(np.einsum("ij,ij->i", response_vectors, response_vectors))
+            norms *= math.sqrt(original_vector @ original_vector)
+            similarity_scores = np.divide(response_vectors @ original_vector, norms,
+                                          out=np.zeros(len(response_intents)), where=norms != 0)
+        else:
+            similarity_scores = np.array([
+                self._calculate_intent_similarity(original_intent.intent_distribution,
+                                                  response_intent.intent_distribution)
+                for response_intent in response_intents
+            ])
+
+        # Check if primary intents match
+        primary_intent_matches = np.array([
+            response_intent.primary_intent == original_intent.primary_intent
+            for response_intent in response_intents
+        ])
+
+        # Calculate overall alignment scores
+        alignment_scores = 0.7 * similarity_scores + 0.3 * primary_intent_matches
+
+        # Determine if alignment is sufficient
+        is_aligned = alignment_scores >= self.min_confidence_threshold
+
+        logger.info("Intent alignment verification: %d of %d responses aligned",
+                    int(is_aligned.sum()), len(responses))
         return is_aligned
 
     def calculate_confidence_score(self, intent: IntentAnalysis) -> float:
@@ -849,28 +1715,26 @@ class IntentAnalyzer:
             Confidence score between 0 and 1
         """
         # Get the probability of the primary intent
-        primary_intent_prob = intent.intent_distribution.get(intent.primary_intent, 0.0)
+        primary_row = self.intent_field_generator._INTENT_INDEX.get(intent.primary_intent)
+        if primary_row is not None and self._uses_field_vector(intent):
+            primary_intent_prob = intent.intent_vector.item(primary_row)
+        else:
+            primary_intent_prob = intent.intent_distribution.get(intent.primary_intent, 0.0)
 
         # Factor in the presence of ambiguity zones (reduces confidence)
         ambiguity_penalty = len(intent.ambiguity_zones) * 0.1
 
         # Apply intent-specific boosting for certain intents that tend to have lower scores
-        intent_boost = 0.0
-        if intent.primary_intent in ["comparison", "brainstorming", "code_generation",
-                                    "educational_content", "explanation", "action_request"]:
-            # These intents typically get lower scores, so boost them
-            intent_boost = 0.15
-        elif intent.primary_intent in ["data_visualization", "data_analysis", "research",
-                                      "recommendation", "problem_solving"]:
-            # These intents get moderate scores, so boost them slightly
-            intent_boost = 0.1
+        intent_boost = _CONFIDENCE_BOOSTS.get(intent.primary_intent, 0.0)
 
         # Calculate final confidence score with boosting
         confidence_score = primary_intent_prob - ambiguity_penalty + intent_boost
 
         # Ensure score is between 0 and 1
-        confidence_score = max(0.0, min(1.0, confidence_score))
-
+        if confidence_score > 1.0:
+            return 1.0
+        if confidence_score <= 0.0:
+            return 0.0
         return confidence_score
 
     def _calculate_intent_similarity(self, dist1: Dict[str, float], dist2: Dict[str, float]) -> float:
@@ -884,21 +1748,67 @@ class IntentAnalyzer:
         Returns:
             Similarity score between 0 and 1
         """
-        # Ensure all intents are in both distributions
-        all_intents = set(dist1.keys()) | set(dist2.keys())
+        # Place both distributions on the canonical intent index; distributions
+        # over other labels fall back to the union of their intents
+        intent_index = ProbabilisticIntentField._INTENT_INDEX
+        if not (dist1.keys() <= intent_index.keys() and dist2.keys() <= intent_index.keys()):
+            intent_index = {intent: row for row, intent in enumerate(dist1.keys() | dist2.keys())}
 
         # Convert to vectors
-        vec1 = np.array([dist1.get(intent, 0.0) for intent in all_intents])
-        vec2 = np.array([dist2.get(intent, 0.0) for intent in all_intents])
+        vec1 = self._distribution_vector(dist1, intent_index)
+        vec2 = self._distribution_vector(dist2, intent_index)
+        return self._cosine_similarity(vec1, vec2)
+
+    def _uses_field_vector(self, intent: IntentAnalysis) -> bool:
+        """
+        Check whether an analysis came from this analyzer's intent field.
+
+        Such analyses cover every category, so their intent_vector holds the
+        whole distribution on the canonical intent index.
 
-        # Calculate cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        Args:
+            intent: Intent analysis object
+
+        Returns:
+            True if intent_vector can stand in for intent_distribution
+        """
+        return intent.intent_labels is self.intent_field_generator.INTENT_CATEGORIES
 
-        if norm1 == 0 or norm2 == 0:
+    @staticmethod
+    def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
+        """
+        Calculate cosine similarity between two intent vectors.
+
+        Args:
+            vec1: First intent vector
+            vec2: Second intent vector
+
+        Returns:
+            Similarity score between 0 and 1
+        """
+        # Work with squared norms, returning early on a zero vector
+        squared_norm1 = vec1.dot(vec1)
+        if squared_norm1 == 0:
+            return 0.0
+        squared_norm2 = vec2.dot(vec2)
+        if squared_norm2 == 0:
             return 0.0
 
-        similarity = dot_product / (norm1 * norm2)
+        return float(vec1.dot(vec2)) / math.sqrt(squared_norm1 * squared_norm2)
+
+    @staticmethod
+    def _distribution_vector(distribution: Dict[str, float], intent_index: Dict[str, int]) -> np.ndarray:
+        """
+        Convert an intent distribution to a dense vector.
 
-        return float(similarity)
+        Args:
+            distribution: Intent distribution
+            intent_index: Row of each intent in the vector
+
+        Returns:
+            Vector of probabilities, zero for intents missing from the distribution
+        """
+        vector = np.zeros(len(intent_index))
+        for intent, probability in distribution.items():
+            vector[intent_index[intent]] = probability
+        return vector
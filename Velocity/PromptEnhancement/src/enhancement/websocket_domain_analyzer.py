@@ -9,6 +9,7 @@ import json
 import re
 import asyncio
 import time
+from operator import attrgetter
 from typing import Dict, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -23,6 +24,8 @@ from src.llm.models import SelectionResult
 
 logger = get_logger(__name__)
 
+_SUCCESS_RATE = attrgetter("success_rate")
+
 
 class WebSocketDomainAnalyzer:
     """
@@ -464,7 +467,7 @@ Rules:
             if user_id and user_id in self.adoption_engine.user_metrics:
                 user_data = self.adoption_engine.user_metrics[user_id]
                 if user_data:
-                    avg_success = sum(m.success_rate for m in user_data.values()) / len(user_data)
+                    avg_success = sum(map(_SUCCESS_RATE, user_data.values())) / len(user_data)
                     if avg_success < 0.7:
                         tips.append("⭐ Try being more specific - your success rate will improve!")
             
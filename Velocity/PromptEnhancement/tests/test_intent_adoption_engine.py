@@ -0,0 +1,76 @@
+import asyncio
+import json
+import time
+
+from src.analysis.intent_adoption_engine import AdoptionStage, IntentAdoptionEngine, IntentAdoptionMetrics
+
+
+INTENTS = ["research", "data_analysis", "content_creation", "code_assistance", "problem_solving", "debugging"]
+
+
+def _track(engine, usages):
+    async def run():
+        for user_id, intent in usages:
+            await engine._track_intent_usage(user_id, intent, f"prompt for {intent}")
+    asyncio.run(run())
+
+
+def test_platform_analytics_orders_tied_intents_by_name():
+    engine = IntentAdoptionEngine()
+    # New intents all start at the same adoption rate, tracked out of name order
+    _track(engine, [(f"user{i % 2}", intent) for i, intent in enumerate(INTENTS)])
+
+    analytics = engine.get_platform_adoption_analytics()
+
+    assert list(analytics["intent_adoption_rates"]) == sorted(INTENTS)
+    assert [intent for intent, _ in analytics["top_adopted_intents"]] == sorted(INTENTS)[:5]
+    assert analytics["improvement_opportunities"] == [
+        "Improve adoption for: code_assistance, content_creation, data_analysis",
+        "Improve success patterns for: code_assistance, content_creation, data_analysis",
+    ]
+
+
+def test_platform_analytics_independent_of_tracking_order():
+    usages = [(f"user{i % 3}", intent) for i, intent in enumerate(INTENTS * 2)]
+    forward, backward = IntentAdoptionEngine(), IntentAdoptionEngine()
+    _track(forward, usages)
+    _track(backward, usages[::-1])
+
+    assert forward.get_platform_adoption_analytics() == backward.get_platform_adoption_analytics()
+
+
+def test_adoption_bytes_match_adoption_analysis():
+    prompts = ["write a python function and then explain it", "research climate data trends"]
+    dict_engine, bytes_engine = IntentAdoptionEngine(), IntentAdoptionEngine()
+
+    async def run():
+        for prompt in prompts:
+            expected = await dict_engine.analyze_intent_for_adoption(prompt, "user0")
+            encoded = await bytes_engine.analyze_intent_for_adoption_bytes(prompt, "user0")
+            assert isinstance(encoded, bytes)
+            assert json.loads(encoded) == expected
+    asyncio.run(run())
+
+
+def test_discovery_user_recommendations_flag_low_success_intent():
+    engine = IntentAdoptionEngine()
+    now = time.time()
+    engine.user_metrics["user0"]["research"] = IntentAdoptionMetrics(
+        user_id="user0",
+        intent_category="research",
+        usage_count=2,
+        success_rate=0.4,
+        avg_confidence=0.5,
+        improvement_trend=0.0,
+        preferred_patterns=[],
+        stage=AdoptionStage.DISCOVERY,
+        last_usage=now,
+        first_usage=now
+    )
+
+    recommendations = engine._get_user_recommendations("user0")
+
+    assert recommendations == [
+        *engine.adoption_strategies[AdoptionStage.DISCOVERY]["tactics"][:2],
+        "Focus on improving research with more specific prompts",
+    ]
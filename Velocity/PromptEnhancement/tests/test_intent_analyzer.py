@@ -0,0 +1,37 @@
+import numpy as np
+
+from src.analysis.intent_analyzer import IntentAnalysis, IntentAnalyzer
+
+
+def test_intent_analysis_accepts_distribution():
+    analysis = IntentAnalysis(
+        intent_distribution={"code_generation": 0.7, "explanation": 0.3},
+        confidence_regions={"code_generation": 0.7},
+        ambiguity_zones=[],
+        primary_intent="code_generation",
+        confidence_score=0.7,
+        clarification_needed=False
+    )
+
+    assert analysis.intent_distribution == {"code_generation": 0.7, "explanation": 0.3}
+    assert analysis.intent_vector.tolist() == [0.7, 0.3]
+
+    analysis.intent_distribution = {"research": 1.0}
+    assert analysis.intent_distribution == {"research": 1.0}
+    assert analysis.to_dict()["intent_distribution"] == {"research": 1.0}
+    assert list(analysis.intent_labels) == ["research"]
+    assert analysis.intent_vector.tolist() == [1.0]
+
+
+def test_intent_analysis_dict_round_trip():
+    analyzer = IntentAnalyzer()
+    labels = analyzer.intent_field_generator.INTENT_CATEGORIES
+
+    for prompt in ("write a python function to sort a list", "compare cats vs dogs and summarize", "hello"):
+        analysis = analyzer.analyze_intent(prompt)
+        data = analysis.to_dict()
+        restored = IntentAnalysis.from_dict(data, labels)
+
+        assert restored == analysis
+        assert np.array_equal(restored.intent_vector, analysis.intent_vector)
+        assert restored.to_dict() == data
@@ -0,0 +1,130 @@
+import json
+import sys
+
+import pytest
+
+from src.analysis import intent_classifier
+from src.analysis.intent_classifier import IntentClassifier, _build_keyword_index, _keyword_slots, _load_keyword_tables
+
+
+PROMPTS = [
+    "write a python function to sort a list",
+    "debug this code, it throws an error when I run the script",
+    "analyze the sales data and find trends in the statistics",
+    "write a blog post about remote work for a young audience",
+    "research the latest papers on climate change",
+    "compare react vs vue for a small dashboard",
+    "hello",
+    "",
+]
+
+
+def _reference_keyword_match_score(text, keywords):
+    """Keyword list score computed one keyword at a time, as the classifier defines it."""
+    text = text.lower()
+    text_words = set(text.split())
+
+    exact_matches = 0
+    partial_matches = 0
+    for keyword in keywords:
+        keyword = keyword.lower()
+        keyword_words = set(keyword.split())
+        if f" {keyword} " in f" {text} " or text.startswith(keyword + " ") or text.endswith(" " + keyword):
+            exact_matches += 4
+        elif any(word in text_words for word in keyword_words):
+            partial_matches += 2
+        elif keyword in text:
+            partial_matches += 1
+
+    total_matches = exact_matches + partial_matches
+    return min(total_matches / (len(keywords) * 0.3), 1.0) if keywords else 0.0
+
+
+@pytest.fixture
+def classifier(tmp_path, monkeypatch):
+    # Uncertain predictions are logged relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    yield IntentClassifier()
+    IntentClassifier.reload()
+
+
+def _keyword_prompts():
+    # Prompts built from the keywords themselves exercise every match kind
+    prompts = list(PROMPTS)
+    for keywords in IntentClassifier.MAIN_INTENT_KEYWORDS.values():
+        prompts.append(" ".join(keywords[:3]))
+        prompts.append(f"please {keywords[-1]}s now")
+    return prompts
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_keyword_list_scores_match_reference(classifier, monkeypatch, use_automaton):
+    if use_automaton and intent_classifier.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+    if not use_automaton:
+        monkeypatch.setattr(intent_classifier, "ahocorasick", None)
+    main_keywords, sub_keywords = IntentClassifier.MAIN_INTENT_KEYWORDS, IntentClassifier.SUB_INTENT_KEYWORDS
+    index = _build_keyword_index(main_keywords, sub_keywords)
+    assert (index.automaton is not None) == use_automaton
+    slots, _ = _keyword_slots(main_keywords, sub_keywords)
+
+    for prompt in _keyword_prompts():
+        text = prompt.lower()
+        expected = [_reference_keyword_match_score(text, keywords) for keywords in slots]
+        assert classifier._keyword_list_scores(text, index) == expected, prompt
+
+
+def test_load_keyword_tables(tmp_path):
+    path = tmp_path / "intent_keywords.json"
+    path.write_text(json.dumps({
+        "main": {"code_assistance": ["code", "debug"]},
+        "sub": {"code_assistance": {"debugging": ["bug", "error"]}},
+    }), encoding="utf-8")
+
+    main_keywords, sub_keywords = _load_keyword_tables(path)
+
+    assert main_keywords == {"code_assistance": ("code", "debug")}
+    assert sub_keywords == {"code_assistance": {"debugging": ("bug", "error")}}
+    # Keywords are interned so repeated occurrences share one string
+    assert main_keywords["code_assistance"][0] is sys.intern("code")
+
+
+def test_packaged_keyword_tables_cover_sub_intents():
+    main_keywords, sub_keywords = _load_keyword_tables(intent_classifier._KEYWORD_TABLES_PATH)
+
+    assert main_keywords == IntentClassifier.MAIN_INTENT_KEYWORDS
+    assert sub_keywords == IntentClassifier.SUB_INTENT_KEYWORDS
+    assert set(sub_keywords) <= set(main_keywords)
+    assert all(keywords for keywords in main_keywords.values())
+
+
+def test_reload_picks_up_new_keywords(classifier, tmp_path):
+    prompt = "please frobnicate the widgets"
+    before = classifier.classify_intent(prompt)
+    assert before.confidence == 0.0
+
+    main_intent = next(intent for intent in IntentClassifier.MAIN_INTENT_KEYWORDS if intent != before.main_intent)
+    tables = {
+        "main": {intent: list(keywords) for intent, keywords in IntentClassifier.MAIN_INTENT_KEYWORDS.items()},
+        "sub": {
+            intent: {sub_intent: list(keywords) for sub_intent, keywords in sub_intents.items()}
+            for intent, sub_intents in IntentClassifier.SUB_INTENT_KEYWORDS.items()
+        },
+    }
+    tables["main"][main_intent] = ["frobnicate"]
+    path = tmp_path / "intent_keywords.json"
+    path.write_text(json.dumps(tables), encoding="utf-8")
+
+    IntentClassifier.reload(path)
+    assert IntentClassifier._keyword_index.cache_info().currsize == 0
+    after = classifier.classify_intent(prompt)
+    # The instance dropped its classifications made with the old tables
+    assert classifier._cached_classification.cache_info().hits == 0
+
+    assert after.main_intent == main_intent
+    assert after.confidence == 1.0
+    assert not after.needs_review
+
+    # Reloading the packaged tables restores the original classification
+    IntentClassifier.reload()
+    assert classifier.classify_intent(prompt) == before